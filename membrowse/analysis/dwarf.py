@@ -85,6 +85,8 @@ class DWARFProcessor:  # pylint: disable=too-many-instance-attributes,too-few-pu
             # (symbol_name, address) -> filename
             'symbol_to_file': {},
             'address_to_cu_file': {},       # address -> cu_filename
+            # (low_pc, high_pc, cu_source_file) for CUs with explicit ranges
+            'cu_ranges': [],
             'processed_cus': set(),         # Cache of processed CUs to avoid duplicates
             # List of (symbol_name, cu_source_file, decl_file) for static vars
             'static_symbol_mappings': [],
@@ -353,6 +355,12 @@ class DWARFProcessor:  # pylint: disable=too-many-instance-attributes,too-few-pu
             else:
                 cu_source_file = cu_name
 
+        # Record the CU's code range so addresses the line program does not
+        # cover can still be attributed to the CU by interval lookup
+        if cu_source_file and (cu_low_pc, cu_high_pc) != (0, MAX_ADDRESS):
+            self.dwarf_data['cu_ranges'].append(
+                (cu_low_pc, cu_high_pc, cu_source_file))
+
         # Process both line program and DIE data as they provide complementary information:
         # - Line program: Maps instruction addresses to source files (useful for functions)
         # - DIE data: Maps symbol definitions to source files (more accurate for variables)
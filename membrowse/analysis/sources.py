@@ -9,7 +9,8 @@ using DWARF debug information, with optimizations for performance and accuracy.
 import os
 import re
 import bisect
-from typing import Any, Dict, Optional
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from .symbols import strip_compiler_suffix
 
@@ -17,44 +18,80 @@ from .symbols import strip_compiler_suffix
 # These are compiler internals, not real source files.
 _CGU_HASH_PATTERN = re.compile(r'^.+\.[0-9a-f]+-cgu\.\d+$')
 
+# (symbol_name, cu_source_file, best_source_file) from DWARFProcessor
+_StaticMapping = Tuple[str, Optional[str], str]
 
-class SourceFileResolver:  # pylint: disable=too-few-public-methods
+
+class SourceFileResolver:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """Handles source file resolution logic for symbols using DWARF debug information"""
 
+    # Resolved once per symbol; slots skip the instance __dict__ on every
+    # attribute access in the resolution hot path.
+    __slots__ = (
+        'dwarf_data',
+        'system_header_cache',
+        'used_static_mappings',
+        '_static_symbol_lookup',
+        '_basename_cache',
+        '_sorted_addresses',
+        '_address_resolved',
+        '_nearby_cache',
+        '_cu_ranges',
+        '_cu_range_starts',
+    )
+
     def __init__(self, dwarf_data: Dict[str, Any],
                  system_header_cache: Dict[str, bool]):
         """Initialize with DWARF data dictionaries and system header cache."""
         self.dwarf_data = dwarf_data
         self.system_header_cache = system_header_cache
-        self.used_static_mappings = {}  # Track which static mappings have been used
+        # Track which static mappings have been used
+        self.used_static_mappings: Dict[str, int] = {}
 
         # Pre-build static symbol mappings lookup for O(1) access
-        self._static_symbol_lookup = {}
-        self._basename_cache = {}  # Cache basename computations
-        self._sorted_addresses = None  # Lazy initialization for address lookup
+        self._static_symbol_lookup: Dict[str, List[_StaticMapping]] = {}
+        # path -> (basename, is_c, is_h)
+        self._basename_cache: Dict[str, Tuple[str, bool, bool]] = {}
+        # Lazy initialization for address lookup
+        self._sorted_addresses: Optional[array] = None
+        # address -> resolved basename (FUNC fallback)
+        self._address_resolved: Dict[int, str] = {}
+        # (address, max_distance) -> nearby address or None
+        self._nearby_cache: Dict[Tuple[int, int], Optional[int]] = {}
+        # Lazy initialization for CU interval lookup
+        self._cu_ranges: Optional[List[Tuple[int, int, str]]] = None
+        self._cu_range_starts: Optional[array] = None
         if 'static_symbol_mappings' in dwarf_data:
             for mapping in dwarf_data['static_symbol_mappings']:
                 symbol_name = mapping[0]
                 if symbol_name not in self._static_symbol_lookup:
                     self._static_symbol_lookup[symbol_name] = []
                 # Pre-compute basename to avoid repeated os.path.basename calls
-                source_file = mapping[2]
-                if source_file not in self._basename_cache:
-                    self._basename_cache[source_file] = os.path.basename(
-                        source_file)
+                self._get_basename(mapping[2])
                 self._static_symbol_lookup[symbol_name].append(mapping)
 
     def _get_basename(self, source_file: str) -> str:
         """Get basename with caching to avoid repeated os.path.basename calls."""
-        if source_file not in self._basename_cache:
-            self._basename_cache[source_file] = os.path.basename(source_file)
-        return self._basename_cache[source_file]
+        return self._get_source_info(source_file)[0]
+
+    def _get_source_info(self, source_file: str) -> Tuple[str, bool, bool]:
+        """Get ``(basename, is_c, is_h)`` for a source path, cached per path.
+
+        The same CU and header paths recur for thousands of symbols, so a
+        single dict probe replaces the split and the suffix checks on every hit.
+        """
+        info = self._basename_cache.get(source_file)
+        if info is None:
+            basename = os.path.basename(source_file)
+            info = (basename, basename.endswith('.c'), basename.endswith('.h'))
+            self._basename_cache[source_file] = info
+        return info
 
     def extract_source_file(
             self,
             symbol_name: str,
             symbol_type: str,
-            symbol_address: int = None) -> str:
+            symbol_address: Optional[int] = None) -> str:
         """Extract source file using pre-built DWARF dictionaries.
 
         This method uses fast dictionary lookups instead of parsing DWARF data.
@@ -73,6 +110,31 @@ class SourceFileResolver:  # pylint: disable=too-few-public-methods
             return ""
         return result
 
+    def extract_source_files(
+            self,
+            symbols: Sequence[Tuple[str, str, Optional[int]]]) -> List[str]:
+        """Extract source files for many symbols in one pass.
+
+        Equivalent to calling :meth:`extract_source_file` for each
+        ``(symbol_name, symbol_type, symbol_address)`` tuple in order, with
+        the per-call setup hoisted out of the loop. Order matters: static
+        symbols sharing a name are matched to DWARF entries sequentially.
+
+        Returns:
+            List of source file basenames aligned with ``symbols``
+        """
+        if not self.dwarf_data:
+            return [""] * len(symbols)
+
+        resolve = self._resolve_source_file
+        cgu_match = _CGU_HASH_PATTERN.match
+        results = []
+        append = results.append
+        for symbol_name, symbol_type, symbol_address in symbols:
+            result = resolve(symbol_name, symbol_type, symbol_address)
+            append("" if result and cgu_match(result) else result)
+        return results
+
     def extract_source_line(self, symbol_address: Optional[int]) -> int:
         """Return the source line for a symbol address from the DWARF line program.
 
@@ -94,11 +156,11 @@ class SourceFileResolver:  # pylint: disable=too-few-public-methods
             return addr_to_line.get(nearby, 0)
         return 0
 
-    def _resolve_source_file(  # pylint: disable=too-many-return-statements,too-many-branches
+    def _resolve_source_file(  # pylint: disable=too-many-return-statements,too-many-branches,too-many-locals
             self,
             symbol_name: str,
             symbol_type: str,
-            symbol_address: int = None) -> str:
+            symbol_address: Optional[int] = None) -> str:
         """Internal source file resolution with priority-based fallback chain."""
         # Use dictionary-based lookups for maximum performance
         if not self.dwarf_data:
@@ -108,28 +170,29 @@ class SourceFileResolver:  # pylint: disable=too-few-public-methods
         # most reliable)
         # DWARF DIE names don't include compiler suffixes (.part.0, etc.),
         # so try the stripped name if the original key misses.
-        symbol_key = (symbol_name, symbol_address or 0)
-        if symbol_key not in self.dwarf_data['symbol_to_file']:
+        symbol_to_file = self.dwarf_data['symbol_to_file']
+        lookup_address = symbol_address or 0
+        source_file = symbol_to_file.get((symbol_name, lookup_address))
+        if source_file is None:
             stripped = strip_compiler_suffix(symbol_name)
             if stripped != symbol_name:
-                symbol_key = (stripped, symbol_address or 0)
+                source_file = symbol_to_file.get((stripped, lookup_address))
 
-        if symbol_key in self.dwarf_data['symbol_to_file']:
-            source_file = self.dwarf_data['symbol_to_file'][symbol_key]
-            source_file_basename = self._get_basename(source_file)
+        if source_file is not None:
+            source_file_basename, is_c, is_h = self._get_source_info(source_file)
 
             # For FUNC symbols, if DIE points to .c file, trust it over line program
             # This handles cases with inlined functions from headers
-            if symbol_type == 'FUNC' and source_file_basename.endswith('.c'):
+            if symbol_type == 'FUNC' and is_c:
                 return source_file_basename
 
             # For .h files, check if we should prefer the CU source file
-            if (source_file_basename.endswith('.h')
-                    and symbol_address is not None and symbol_address > 0):
-                if symbol_address in self.dwarf_data['address_to_cu_file']:
-                    cu_source_file = self.dwarf_data['address_to_cu_file'][symbol_address]
-                    if cu_source_file and cu_source_file.endswith('.c'):
-                        return self._get_basename(cu_source_file)
+            if is_h and symbol_address is not None and symbol_address > 0:
+                cu_source_file = self.dwarf_data['address_to_cu_file'].get(symbol_address)
+                if cu_source_file:
+                    cu_basename, cu_is_c, _ = self._get_source_info(cu_source_file)
+                    if cu_is_c:
+                        return cu_basename
 
             return source_file_basename
 
@@ -152,7 +215,7 @@ class SourceFileResolver:  # pylint: disable=too-few-public-methods
         # Priority 3: Fallback lookups for OBJECT symbols and edge cases
         return self._resolve_fallback(symbol_name, symbol_address)
 
-    def _resolve_static_symbol(self, symbol_name: str, symbol_address: int) -> str:
+    def _resolve_static_symbol(self, symbol_name: str, symbol_address: Optional[int]) -> str:
         """Resolve static symbols with duplicate names using CU-based matching.
 
         Args:
@@ -194,59 +257,81 @@ class SourceFileResolver:  # pylint: disable=too-few-public-methods
         return self._get_basename(source_file)
 
     def _resolve_by_address(self, symbol_address: int) -> str:
-        """Resolve source file by symbol address."""
-        # Exact address lookup
-        if symbol_address in self.dwarf_data['address_to_file']:
-            source_file = self.dwarf_data['address_to_file'][symbol_address]
-            source_file_basename = self._get_basename(source_file)
-
-            # Prefer .c files over .h files when available
-            if (source_file_basename.endswith('.h')
-                    and symbol_address in self.dwarf_data['address_to_cu_file']):
-                cu_source_file = self.dwarf_data['address_to_cu_file'][symbol_address]
-                if cu_source_file and cu_source_file.endswith('.c'):
-                    return self._get_basename(cu_source_file)
+        """Resolve source file by symbol address.
 
-            return source_file_basename
-
-        # Proximity search using optimized algorithm
-        nearby_addr = self._find_nearby_address(symbol_address)
-        if nearby_addr is not None:
-            source_file = self.dwarf_data['address_to_file'][nearby_addr]
-            source_file_basename = self._get_basename(source_file)
-
-            # Apply .h/.c preference logic
-            if (source_file_basename.endswith('.h')
-                    and nearby_addr in self.dwarf_data['address_to_cu_file']):
-                cu_source_file = self.dwarf_data['address_to_cu_file'][nearby_addr]
-                if cu_source_file and cu_source_file.endswith('.c'):
-                    return self._get_basename(cu_source_file)
-
-            return source_file_basename
-
-        return ""
+        The answer depends only on the address and the (immutable) DWARF
+        dictionaries, so it is memoized per address.
+        """
+        result = self._address_resolved.get(symbol_address)
+        if result is None:
+            result = self._resolve_by_address_uncached(symbol_address)
+            self._address_resolved[symbol_address] = result
+        return result
 
-    def _resolve_fallback(self, symbol_name: str, symbol_address: int) -> str:
+    def _resolve_by_address_uncached(self, symbol_address: int) -> str:
+        """Resolve source file by symbol address without consulting the memo."""
+        # Exact address lookup, then proximity search using optimized algorithm
+        address_to_file = self.dwarf_data['address_to_file']
+        line_address = symbol_address
+        source_file = address_to_file.get(line_address)
+        if source_file is None:
+            line_address = self._find_nearby_address(symbol_address)
+            if line_address is None:
+                # No line entry close by; fall back to the enclosing CU
+                cu_source_file = self._find_cu_file(symbol_address)
+                return self._get_basename(cu_source_file) if cu_source_file else ""
+            source_file = address_to_file[line_address]
+
+        source_file_basename, _, is_h = self._get_source_info(source_file)
+
+        # Prefer .c files over .h files when available
+        if is_h:
+            cu_source_file = self.dwarf_data['address_to_cu_file'].get(line_address)
+            if cu_source_file:
+                cu_basename, cu_is_c, _ = self._get_source_info(cu_source_file)
+                if cu_is_c:
+                    return cu_basename
+
+        return source_file_basename
+
+    def _resolve_fallback(self, symbol_name: str, symbol_address: Optional[int]) -> str:
         """Fallback resolution methods for edge cases."""
+        # Address-less symbols were already looked up under (name, 0) by the
+        # DIE-direct tier; probing the same keys again cannot succeed.
+        if not symbol_address:
+            return ""
+
         # Try address-based CU mapping
-        if symbol_address is not None and symbol_address > 0:
-            if symbol_address in self.dwarf_data['address_to_cu_file']:
-                source_file = self.dwarf_data['address_to_cu_file'][symbol_address]
-                return self._get_basename(source_file)
+        source_file = self.dwarf_data['address_to_cu_file'].get(symbol_address)
+        if source_file is not None:
+            return self._get_basename(source_file)
 
         # Try symbol with address=0 fallback
-        fallback_key = (symbol_name, 0)
-        if fallback_key not in self.dwarf_data['symbol_to_file']:
+        symbol_to_file = self.dwarf_data['symbol_to_file']
+        source_file = symbol_to_file.get((symbol_name, 0))
+        if source_file is None:
             stripped = strip_compiler_suffix(symbol_name)
             if stripped != symbol_name:
-                fallback_key = (stripped, 0)
-        if fallback_key in self.dwarf_data['symbol_to_file']:
-            source_file = self.dwarf_data['symbol_to_file'][fallback_key]
+                source_file = symbol_to_file.get((stripped, 0))
+        if source_file is not None:
             return self._get_basename(source_file)
 
         # No source file information found
         return ""
 
+    def _find_cu_file(self, target_address: int) -> Optional[str]:
+        """Find the source file of the CU whose address range covers the target."""
+        if self._cu_range_starts is None:
+            self._cu_ranges = sorted(self.dwarf_data.get('cu_ranges', ()))
+            self._cu_range_starts = array(
+                'Q', [low for low, _, _ in self._cu_ranges])
+
+        idx = bisect.bisect_right(self._cu_range_starts, target_address) - 1
+        if idx < 0:
+            return None
+        _, high_pc, cu_source_file = self._cu_ranges[idx]
+        return cu_source_file if target_address < high_pc else None
+
     def _find_nearby_address(
             self,
             target_address: int,
@@ -255,33 +340,34 @@ class SourceFileResolver:  # pylint: disable=too-few-public-methods
         if not self.dwarf_data['address_to_file']:
             return None
 
-        # Create sorted list from dictionary keys for efficient search
+        # Create sorted array from dictionary keys for efficient search.
+        # Packed 64-bit storage keeps large line tables compact compared to
+        # a list of boxed ints; bisect works on it directly.
         if self._sorted_addresses is None:
             addresses = self.dwarf_data['address_to_file'].keys()
-            self._sorted_addresses = sorted(addresses)
-
-        # Binary search to find closest address
-        idx = bisect.bisect_left(self._sorted_addresses, target_address)
-
-        candidates = []
-
-        # Check address at or after target
-        if idx < len(self._sorted_addresses):
-            addr = self._sorted_addresses[idx]
-            distance = abs(addr - target_address)
-            if distance <= max_distance:
-                candidates.append((distance, addr))
-
-        # Check address before target
-        if idx > 0:
-            addr = self._sorted_addresses[idx - 1]
-            distance = abs(addr - target_address)
-            if distance <= max_distance:
-                candidates.append((distance, addr))
-
-        # Return closest address
-        if candidates:
-            candidates.sort()  # Sort by distance
-            return candidates[0][1]  # Return address with minimum distance
-
-        return None
+            self._sorted_addresses = array('Q', sorted(addresses))
+
+        cache_key = (target_address, max_distance)
+        if cache_key in self._nearby_cache:
+            return self._nearby_cache[cache_key]
+
+        # Binary search to find closest address. bisect_left guarantees the
+        # lower neighbour is below the target and the upper one is at or
+        # above it, so distances need no abs(); ties go to the lower address.
+        sorted_addresses = self._sorted_addresses
+        idx = bisect.bisect_left(sorted_addresses, target_address)
+        out_of_range = max_distance + 1
+        lower_distance = (target_address - sorted_addresses[idx - 1]
+                          if idx > 0 else out_of_range)
+        upper_distance = (sorted_addresses[idx] - target_address
+                          if idx < len(sorted_addresses) else out_of_range)
+
+        if lower_distance <= upper_distance:
+            nearby = (sorted_addresses[idx - 1]
+                      if lower_distance <= max_distance else None)
+        else:
+            nearby = (sorted_addresses[idx]
+                      if upper_distance <= max_distance else None)
+
+        self._nearby_cache[cache_key] = nearby
+        return nearby
@@ -273,10 +273,6 @@ class SymbolExtractor:  # pylint: disable=too-few-public-methods
                 section_name = self._get_symbol_section_name(
                     symbol, section_names)
 
-                # Get source file using the source resolver
-                source_file = source_resolver.extract_source_file(
-                    symbol_name, symbol_type, symbol_address
-                )
                 source_line = source_resolver.extract_source_line(symbol_address)
 
                 # Get symbol visibility
@@ -321,13 +317,20 @@ class SymbolExtractor:  # pylint: disable=too-few-public-methods
                     type=symbol_type,
                     binding=symbol_binding,
                     section=section_name,
-                    source_file=source_file,
+                    source_file='',
                     source_line=source_line,
                     visibility=visibility,
                     archive=archive,
                     object_file=object_file
                 ))
 
+            # Resolve source files for all symbols in one batch, in symbol
+            # table order (static symbols sharing a name match sequentially)
+            source_files = source_resolver.extract_source_files(
+                [(sym.name, sym.type, sym.address) for sym in symbols])
+            for sym, source_file in zip(symbols, source_files):
+                sym.source_file = source_file
+
         except (IOError, OSError) as e:
             raise SymbolExtractionError(
                 f"Failed to read ELF file for symbol extraction: {e}") from e
@@ -5,7 +5,7 @@ Provides MemBrowseClient class for interacting with the MemBrowse API:
 uploading memory analysis reports and retrieving summaries.
 """
 
-import copy
+import gzip
 import json
 import logging
 import os
@@ -18,10 +18,31 @@ import requests
 
 from ..auth.strategy import AuthContext
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 PACKAGE_VERSION = version('membrowse')
 
+# Report JSON is highly repetitive; level 6 gets most of the size reduction
+# of level 9 at a fraction of the CPU cost.
+GZIP_COMPRESS_LEVEL = 6
+
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize an upload payload to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed (``pip install membrowse[fast]``) and
+    falls back to the standard library otherwise. Both produce compact JSON
+    the API accepts; orjson is markedly faster on large symbol lists.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode('utf-8')
+
 
 def _detect_ci_platform() -> str:
     """Detect the CI platform from environment variables."""
@@ -35,16 +56,19 @@ def _detect_ci_platform() -> str:
 class MemBrowseClient:
     """Handles API requests to MemBrowse (upload reports, get summaries)."""
 
-    def __init__(self, auth_context: AuthContext, api_base_url: str):
+    def __init__(self, auth_context: AuthContext, api_base_url: str,
+                 compress: bool = True):
         """
         Initialize client with authentication context.
 
         Args:
             auth_context: Authentication context with strategy and credentials
             api_base_url: API base URL (e.g., 'https://api.membrowse.com')
+            compress: Gzip report uploads (sent with Content-Encoding: gzip)
         """
         self.auth_context = auth_context
         self.api_base_url = api_base_url.rstrip('/')
+        self.compress = compress
         self.session = requests.Session()
 
         # Build headers based on auth strategy
@@ -69,27 +93,35 @@ class MemBrowseClient:
             requests.exceptions.RequestException: For other request errors
             json.JSONDecodeError: If response cannot be parsed as JSON
         """
-        # Create a copy to avoid mutating the input
-        report_to_send = copy.deepcopy(report_data)
-
-        # Add auth-specific metadata (e.g., github_context for tokenless uploads)
+        # Add auth-specific metadata (e.g., github_context for tokenless uploads).
+        # Only the envelope and its metadata dict are copied so the input is
+        # not mutated; memory_analysis (symbols etc.) is shared, not duplicated.
+        report_to_send = report_data
         metadata_additions = self.auth_context.get_metadata_additions()
         if metadata_additions:
-            if 'metadata' not in report_to_send:
-                report_to_send['metadata'] = {}
-            report_to_send['metadata'].update(metadata_additions)
+            report_to_send = dict(report_data)
+            report_to_send['metadata'] = {
+                **report_data.get('metadata', {}),
+                **metadata_additions,
+            }
 
         url = f"{self.api_base_url}/upload"
         commit_hash = report_to_send.get('metadata', {}).get('git', {}).get('commit_hash', '')
 
-        json_bytes = json.dumps(report_to_send).encode('utf-8')
-        logger.debug("Uploading payload: %d bytes", len(json_bytes))
+        body = _encode_json(report_to_send)
+        headers = {'Content-Type': 'application/json'}
+        if self.compress:
+            json_size = len(body)
+            body = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+            headers['Content-Encoding'] = 'gzip'
+            logger.debug("Uploading payload: %d bytes (%d bytes gzipped)",
+                         json_size, len(body))
+        else:
+            logger.debug("Uploading payload: %d bytes", len(body))
         return self._request_with_retry(
             'POST', url, log_context=commit_hash,
-            data=json_bytes,
-            headers={
-                'Content-Type': 'application/json',
-            },
+            data=body,
+            headers=headers,
         )
 
     def get_summary(self, commit_sha: str) -> Dict[str, Any]:
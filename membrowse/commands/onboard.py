@@ -206,6 +206,12 @@ examples:
         help='Run the full onboard workflow (checkout, build, analyze) but skip '
              'uploading reports. Logs what would be uploaded for each commit.'
     )
+    parser.add_argument(
+        '--no-compress',
+        dest='no_compress',
+        action='store_true',
+        help='Send reports as plain JSON instead of gzip-compressed'
+    )
     parser.add_argument(
         '--map-file',
         dest='map_file',
@@ -584,7 +590,8 @@ def _create_client(args, api_url=None):
     """Create a reusable MemBrowseClient from onboard args."""
     resolved_api_url = api_url if api_url is not None else args.api_url
     auth_context = determine_auth_strategy(api_key=args.api_key)
-    return MemBrowseClient(auth_context, resolved_api_url)
+    return MemBrowseClient(auth_context, resolved_api_url,
+                           compress=not getattr(args, 'no_compress', False))
 
 
 def _upload_commit(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
@@ -364,6 +364,11 @@ examples:
         help='Mark this commit as having identical memory footprint to previous '
              '(metadata-only upload, no build analysis required)'
     )
+    upload_group.add_argument(
+        '--no-compress',
+        action='store_true',
+        help='Send the report as plain JSON instead of gzip-compressed'
+    )
 
     # Optional Git metadata (overrides auto-detected values)
     git_group = parser.add_argument_group(
@@ -726,7 +731,7 @@ def _create_metadata_only_report() -> dict:
     }
 
 
-def upload_report(  # pylint: disable=too-many-arguments
+def upload_report(  # pylint: disable=too-many-arguments,too-many-locals
     report: dict,
     commit_info: dict,
     target_name: str,
@@ -736,7 +741,8 @@ def upload_report(  # pylint: disable=too-many-arguments
     build_failed: bool = None,
     identical: bool = False,
     is_github_mode: bool = False,
-    client: Optional[MemBrowseClient] = None
+    client: Optional[MemBrowseClient] = None,
+    compress: bool = True
 ) -> tuple[dict, str]:
     """
     Upload a memory footprint report to MemBrowse platform.
@@ -763,6 +769,8 @@ def upload_report(  # pylint: disable=too-many-arguments
         identical: Whether this commit has identical memory footprint to previous
                    (no changes in build directories, metadata-only report)
         is_github_mode: Whether --github flag is set (enables tokenless for fork PRs)
+        client: Optional pre-built client to reuse across uploads
+        compress: Gzip the upload body (ignored when ``client`` is given)
 
     Returns:
         tuple[dict, str]: (API response data, comparison URL if available)
@@ -791,7 +799,7 @@ def upload_report(  # pylint: disable=too-many-arguments
     # Upload to MemBrowse
     response_data = _perform_upload(
         enriched_report, api_key, api_url, log_prefix,
-        is_github_mode=is_github_mode, client=client
+        is_github_mode=is_github_mode, client=client, compress=compress
     )
 
     # Always print upload response details (success or failure)
@@ -851,7 +859,8 @@ def _perform_upload(  # pylint: disable=too-many-arguments,too-many-positional-a
     api_url: str,
     log_prefix: str,
     is_github_mode: bool = False,
-    client: Optional[MemBrowseClient] = None
+    client: Optional[MemBrowseClient] = None,
+    compress: bool = True
 ) -> dict:
     """Perform the actual upload to MemBrowse."""
     try:
@@ -861,7 +870,7 @@ def _perform_upload(  # pylint: disable=too-many-arguments,too-many-positional-a
                 api_key=api_key,
                 auto_detect_fork=is_github_mode
             )
-            client = MemBrowseClient(auth_context, api_url)
+            client = MemBrowseClient(auth_context, api_url, compress=compress)
         return client.upload_report(enriched_report)
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.error("%s: Failed to upload report to %s: %s", log_prefix, api_url, e)
@@ -949,6 +958,7 @@ def _handle_upload_and_alerts(
             api_url=getattr(args, 'api_url', DEFAULT_API_URL),
             identical=getattr(args, 'identical', False),
             is_github_mode=getattr(args, 'github', False),
+            compress=not getattr(args, 'no_compress', False),
         )
 
         # Check for budget alerts first to determine exit code
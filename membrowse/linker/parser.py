@@ -35,6 +35,76 @@ from .base import LinkerFormatDetector
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fixed patterns are compiled once at import; the cleaner, evaluator and
+# region builder run them for every script, expression and MEMORY block.
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_LINE_COMMENT_RE = re.compile(r"//.*")
+# GNU LD syntax: `INCLUDE filename` with optional quoting.
+_INCLUDE_RE = re.compile(
+    r'\bINCLUDE\s+"([^"]+)"|\bINCLUDE\s+(\S+?)\s*;?(?=\s|$)')
+_PREPROCESSOR_LINE_RE = re.compile(
+    r"#[a-zA-Z_][a-zA-Z0-9_]*\b.*$", re.MULTILINE)
+_PREPROCESSOR_IF_BLOCK_RE = re.compile(
+    r"#if[^#]*?(?:#(?:elif|else)[^#]*?)*?#endif", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_SECTIONS_KEYWORD_RE = re.compile(r"\bSECTIONS\b")
+_MEMORY_BLOCK_RE = re.compile(r"MEMORY\s*\{([^}]+)\}", re.IGNORECASE)
+_VARIABLE_ASSIGNMENT_RE = re.compile(
+    r"([A-Za-z_][A-Za-z0-9_]*)\s*=\s*([^;]+);")
+
+_DEFINED_RE = re.compile(r"DEFINED\s*\(\s*([^)]+)\s*\)")
+_ORIGIN_RE = re.compile(r"ORIGIN\s*\(\s*([^)]+)\s*\)")
+_LENGTH_RE = re.compile(r"LENGTH\s*\(\s*([^)]+)\s*\)")
+_ADDR_RE = re.compile(r"ADDR\s*\(\s*([^)]+)\s*\)")
+_SIZEOF_RE = re.compile(r"SIZEOF\s*\(\s*([^)]+)\s*\)")
+_ABSOLUTE_RE = re.compile(r"ABSOLUTE\s*\(")
+# Innermost parentheses (no nested parens inside)
+_INNER_PARENS_RE = re.compile(r"\(\s*([^()]+)\s*\)")
+
+_HEX_LITERAL_RE = re.compile(r"0[xX]([0-9a-fA-F]+)")
+_OCTAL_LITERAL_RE = re.compile(r"\b0([0-7]+)\b")
+# Numbers with size suffixes: 256K, 1M, etc.
+_SIZE_SUFFIX_RE = re.compile(r"(\d+)\s*([KMG]B?)\b", re.IGNORECASE)
+_SIZE_MULTIPLIERS = {
+    "K": 1024,
+    "M": 1024 * 1024,
+    "G": 1024 * 1024 * 1024,
+    "KB": 1024,
+    "MB": 1024 * 1024,
+    "GB": 1024 * 1024 * 1024,
+}
+# A lone hex, decimal or suffixed decimal literal (0x08000000, 4096, 512K).
+# Leading-zero decimals are left to the full evaluator, which reads them as
+# octal.
+_PLAIN_LITERAL_RE = re.compile(
+    r"^(?:0x([0-9a-f]+)|(\d+)([KMG]B?)|([1-9]\d*|0))$", re.IGNORECASE)
+# Only allow safe arithmetic characters (<< >> bitshift and & | ^ ~ bitwise
+# ops — ESP-IDF memory.ld sizes segments with the alignment idiom
+# (x + 7) & ~7).
+_SAFE_ARITHMETIC_RE = re.compile(r"^[0-9+\-*/<>()&|^~ \t]+$")
+_SIMPLE_HEX_RE = re.compile(r"^0[xX][0-9a-fA-F]+$")
+_SIMPLE_SIZE_RE = re.compile(r"^\d+[kKmMgG]?$")
+_LITERAL_ARITHMETIC_RE = re.compile(r"^[0-9a-fA-Fx+\-*/() \t]+$")
+
+# Shared lookahead: matches start of next region definition or end of block
+_REGION_LOOKAHEAD = (
+    r"(?=\s+\w+\s*(?:\([^)]*\)\s*)?:\s*(?:ORIGIN|origin|org)\s*=|$|\s*})"
+)
+# Standard format (with attributes in parentheses)
+_STANDARD_REGION_RE = re.compile(
+    r"(\w+)\s*\(([^)]+)\)\s*:\s*(?:ORIGIN|origin|org)\s*=\s*([^,]+),\s*"
+    r"(?:LENGTH|length|len)\s*=\s*([^,}]+?)" + _REGION_LOOKAHEAD)
+# ESP8266/alternative format (no attributes in parentheses)
+_ALT_REGION_RE = re.compile(
+    r"(\w+)\s*:\s*(?:ORIGIN|origin|org)\s*=\s*([^,]+),\s*"
+    r"(?:LENGTH|length|len)\s*=\s*([^,}]+?)" + _REGION_LOOKAHEAD)
+# No-comma format (whitespace separator, used in some Intel/embedded scripts).
+# Must handle expressions with spaces (e.g., "ADDR(x) - ADDR(y)")
+_NO_COMMA_REGION_RE = re.compile(
+    r"(\w+)\s*:\s*(?:ORIGIN|origin|org)\s*=\s*([^\s]+(?:\s*[-+*/]\s*[^\s]+)*)\s+"
+    r"(?:LENGTH|length|len)\s*=\s*([^/\n]+?)"
+    r"(?=\s*(?://|$|\n|\w+\s*(?:\([^)]*\)\s*)?:\s*(?:ORIGIN|origin|org)\s*=))")
+
 
 @dataclass
 class MemoryRegion:  # pylint: disable=too-few-public-methods
@@ -107,12 +177,8 @@ class ScriptContentCleaner:  # pylint: disable=too-few-public-methods
 
         # Strip comments so INCLUDE directives inside comments aren't matched.
         # clean_content re-runs these regexes; the operation is idempotent.
-        scan = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
-        scan = re.sub(r"//.*", "", scan)
-
-        # GNU LD syntax: `INCLUDE filename` with optional quoting.
-        include_pattern = re.compile(
-            r'\bINCLUDE\s+"([^"]+)"|\bINCLUDE\s+(\S+?)\s*;?(?=\s|$)')
+        scan = _BLOCK_COMMENT_RE.sub("", content)
+        scan = _LINE_COMMENT_RE.sub("", scan)
 
         def replace_include(match: re.Match) -> str:
             filename = (match.group(1) or match.group(2)).strip().rstrip(';')
@@ -128,7 +194,8 @@ class ScriptContentCleaner:  # pylint: disable=too-few-public-methods
                 return ""
             visited.add(resolved)
             try:
-                with open(resolved, "r", encoding="utf-8") as f:
+                with open(resolved, "r", encoding="utf-8",
+                          errors="replace") as f:
                     inner = f.read()
             except OSError as exc:
                 logger.warning("Failed to read INCLUDE %s: %s", resolved, exc)
@@ -136,7 +203,7 @@ class ScriptContentCleaner:  # pylint: disable=too-few-public-methods
             return ScriptContentCleaner.resolve_includes(
                 inner, os.path.dirname(resolved), visited, depth + 1)
 
-        return include_pattern.sub(replace_include, scan)
+        return _INCLUDE_RE.sub(replace_include, scan)
 
     @staticmethod
     def _resolve_include_path(filename: str, base_dir: str) -> Optional[str]:
@@ -157,20 +224,18 @@ class ScriptContentCleaner:  # pylint: disable=too-few-public-methods
     def clean_content(content: str) -> str:
         """Remove comments and normalize whitespace from linker script content"""
         # Remove C-style comments /* ... */
-        content = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
+        content = _BLOCK_COMMENT_RE.sub("", content)
         # Remove C++-style comments // ...
-        content = re.sub(r"//.*", "", content)
+        content = _LINE_COMMENT_RE.sub("", content)
 
         # Handle preprocessor directives - remove them and their content
         content = ScriptContentCleaner._remove_preprocessor_blocks(content)
 
         # Remove remaining single-line preprocessor directives
-        content = re.sub(
-            r"#[a-zA-Z_][a-zA-Z0-9_]*\b.*$", "", content, flags=re.MULTILINE
-        )
+        content = _PREPROCESSOR_LINE_RE.sub("", content)
 
         # Normalize whitespace
-        content = re.sub(r"\s+", " ", content)
+        content = _WHITESPACE_RE.sub(" ", content)
         return content
 
     @staticmethod
@@ -184,9 +249,7 @@ class ScriptContentCleaner:  # pylint: disable=too-few-public-methods
         if_blocks_to_remove = []
 
         # Find all #if...#endif blocks
-        if_pattern = r"#if[^#]*?(?:#(?:elif|else)[^#]*?)*?#endif"
-
-        for match in re.finditer(if_pattern, content, re.DOTALL):
+        for match in _PREPROCESSOR_IF_BLOCK_RE.finditer(content):
             block_content = match.group(0)
             # If the block doesn't contain variable assignments, mark it for
             # removal
@@ -229,7 +292,7 @@ class ScriptContentCleaner:  # pylint: disable=too-few-public-methods
         # Find all SECTIONS block starts using word boundary to avoid matching
         # variable names that happen to contain "SECTIONS"
         sections_starts = [
-            m.start() for m in re.finditer(r"\bSECTIONS\b", content)
+            m.start() for m in _SECTIONS_KEYWORD_RE.finditer(content)
         ]
 
         if not sections_starts:
@@ -414,6 +477,17 @@ class ExpressionEvaluator:
         """Evaluate linker script expression with variables and arithmetic"""
         expr = expr.strip()
 
+        # Most ORIGIN/LENGTH values are plain literals; skip the function,
+        # variable and arithmetic passes for them
+        literal = _PLAIN_LITERAL_RE.match(expr)
+        if literal:
+            hex_digits, number, suffix, decimal = literal.groups()
+            if hex_digits:
+                return int(hex_digits, 16)
+            if suffix:
+                return int(number) * _SIZE_MULTIPLIERS[suffix.upper()]
+            return int(decimal)
+
         # Initialize set to track variables being resolved (cycle detection)
         if resolving_vars is None:
             resolving_vars = set()
@@ -477,33 +551,18 @@ class ExpressionEvaluator:
         expr = self._replace_absolute(expr)
 
         # Handle DEFINED() function
-        expr = re.sub(
-            r"DEFINED\s*\(\s*([^)]+)\s*\)",
-            self._replace_defined,
-            expr)
+        expr = _DEFINED_RE.sub(self._replace_defined, expr)
 
         # Handle conditional expressions (ternary) with proper nesting support
         expr = self._evaluate_ternary(expr)
 
         # Handle ORIGIN() and LENGTH() functions
-        expr = re.sub(
-            r"ORIGIN\s*\(\s*([^)]+)\s*\)",
-            self._replace_origin,
-            expr)
-        expr = re.sub(
-            r"LENGTH\s*\(\s*([^)]+)\s*\)",
-            self._replace_length,
-            expr)
+        expr = _ORIGIN_RE.sub(self._replace_origin, expr)
+        expr = _LENGTH_RE.sub(self._replace_length, expr)
 
         # Handle ADDR() and SIZEOF() functions (aliases for ORIGIN/LENGTH)
-        expr = re.sub(
-            r"ADDR\s*\(\s*([^)]+)\s*\)",
-            self._replace_addr,
-            expr)
-        expr = re.sub(
-            r"SIZEOF\s*\(\s*([^)]+)\s*\)",
-            self._replace_sizeof,
-            expr)
+        expr = _ADDR_RE.sub(self._replace_addr, expr)
+        expr = _SIZEOF_RE.sub(self._replace_sizeof, expr)
 
         # Handle parenthesized expressions
         expr = self._resolve_parenthesized_expressions(expr)
@@ -630,7 +689,7 @@ class ExpressionEvaluator:
         """Evaluate DEFINED() function."""
         if "DEFINED(" not in condition:
             return None
-        match = re.search(r"DEFINED\s*\(\s*([^)]+)\s*\)", condition)
+        match = _DEFINED_RE.search(condition)
         if match:
             symbol = match.group(1).strip()
             return symbol in self.variables
@@ -745,7 +804,7 @@ class ExpressionEvaluator:
 
         for _ in range(max_iterations):
             # Find ABSOLUTE( and then match the balanced parentheses
-            match = re.search(r'ABSOLUTE\s*\(', expr)
+            match = _ABSOLUTE_RE.search(expr)
             if not match:
                 break
 
@@ -778,9 +837,6 @@ class ExpressionEvaluator:
         max_iterations = 5
 
         for _ in range(max_iterations):
-            # Find innermost parentheses (no nested parens inside)
-            paren_pattern = r"\(\s*([^()]+)\s*\)"
-
             def resolve_paren_expr(match):
                 inner_expr = match.group(1).strip()
                 try:
@@ -791,7 +847,7 @@ class ExpressionEvaluator:
                     # If we can't evaluate, keep the original expression
                     return match.group(0)
 
-            new_expr = re.sub(paren_pattern, resolve_paren_expr, expr)
+            new_expr = _INNER_PARENS_RE.sub(resolve_paren_expr, expr)
 
             # If no more changes, break
             if new_expr == expr:
@@ -810,12 +866,10 @@ class ExpressionEvaluator:
                               str(var_value), expr)
 
         # Handle hex and octal literals
-        expr = re.sub(r"0[xX]([0-9a-fA-F]+)",
-                      lambda m: str(int(m.group(1), 16)), expr)
+        expr = _HEX_LITERAL_RE.sub(lambda m: str(int(m.group(1), 16)), expr)
 
         # Handle octal literals
-        expr = re.sub(r"\b0([0-7]+)\b",
-                      lambda m: str(int(m.group(1), 8)), expr)
+        expr = _OCTAL_LITERAL_RE.sub(lambda m: str(int(m.group(1), 8)), expr)
 
         # Handle size suffixes
         expr = self._resolve_size_suffixes(expr)
@@ -830,12 +884,10 @@ class ExpressionEvaluator:
     def _evaluate_arithmetic(self, expr: str) -> int:
         """Evaluate arithmetic expressions"""
         # Replace hex and octal literals
-        expr = re.sub(r"0[xX]([0-9a-fA-F]+)",
-                      lambda m: str(int(m.group(1), 16)), expr)
+        expr = _HEX_LITERAL_RE.sub(lambda m: str(int(m.group(1), 16)), expr)
 
         # Replace octal literals (0 followed by digits, but not 0x)
-        expr = re.sub(r"\b0([0-7]+)\b",
-                      lambda m: str(int(m.group(1), 8)), expr)
+        expr = _OCTAL_LITERAL_RE.sub(lambda m: str(int(m.group(1), 8)), expr)
 
         # Use safe arithmetic evaluation instead of eval
         try:
@@ -852,10 +904,7 @@ class ExpressionEvaluator:
 
     def _safe_arithmetic_eval(self, expr: str) -> int:
         """Safely evaluate arithmetic expressions without using eval"""
-        # Only allow safe arithmetic characters (<< >> bitshift and & | ^ ~
-        # bitwise ops — ESP-IDF memory.ld sizes segments with the alignment
-        # idiom (x + 7) & ~7).
-        if not re.match(r"^[0-9+\-*/<>()&|^~ \t]+$", expr):
+        if not _SAFE_ARITHMETIC_RE.match(expr):
             raise ValueError(f"Invalid characters in expression: {expr}")
 
         # Use a simple recursive descent parser for arithmetic
@@ -867,25 +916,12 @@ class ExpressionEvaluator:
 
     def _resolve_size_suffixes(self, expr: str) -> str:
         """Resolve size suffixes (K, M, G) in expressions"""
-        # Handle size multipliers in expressions
-        multipliers = {
-            "K": 1024,
-            "M": 1024 * 1024,
-            "G": 1024 * 1024 * 1024,
-            "KB": 1024,
-            "MB": 1024 * 1024,
-            "GB": 1024 * 1024 * 1024,
-        }
-
-        # Pattern to match numbers with suffixes: 256K, 1M, etc.
-        pattern = r"(\d+)\s*([KMG]B?)\b"
-
         def replace_suffix(match):
             number = int(match.group(1))
             suffix = match.group(2).upper()
-            return str(number * multipliers[suffix])
+            return str(number * _SIZE_MULTIPLIERS[suffix])
 
-        return re.sub(pattern, replace_suffix, expr, flags=re.IGNORECASE)
+        return _SIZE_SUFFIX_RE.sub(replace_suffix, expr)
 
 
 class VariableExtractor:  # pylint: disable=too-few-public-methods
@@ -895,10 +931,17 @@ class VariableExtractor:  # pylint: disable=too-few-public-methods
         self.evaluator = evaluator
         self.variables: Dict[str, Any] = {}
 
-    def extract_from_script(self, script_path: str) -> None:
-        """Extract variable definitions from a linker script"""
-        with open(script_path, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
+    def extract_from_script(self, script_path: str,
+                            content: Optional[str] = None) -> None:
+        """Extract variable definitions from a linker script
+
+        Args:
+            script_path: Path of the script; INCLUDEs resolve relative to it
+            content: Script text, if already read; otherwise read from disk
+        """
+        if content is None:
+            with open(script_path, "r", encoding="utf-8", errors="replace") as f:
+                content = f.read()
 
         # Inline INCLUDE directives before any other preprocessing
         content = ScriptContentCleaner.resolve_includes(
@@ -911,14 +954,11 @@ class VariableExtractor:  # pylint: disable=too-few-public-methods
         # (not linker symbols like __bss_start__ defined inside SECTIONS)
         content = ScriptContentCleaner.strip_sections_content(content)
 
-        # Find variable assignments: var_name = value;
-        var_pattern = r"([A-Za-z_][A-Za-z0-9_]*)\s*=\s*([^;]+);"
-
         # First pass: extract simple variables and store complex ones
         simple_vars = {}
         complex_vars = {}
 
-        for match in re.finditer(var_pattern, content):
+        for match in _VARIABLE_ASSIGNMENT_RE.finditer(content):
             var_name = match.group(1).strip()
             var_value = match.group(2).strip()
 
@@ -974,15 +1014,11 @@ class VariableExtractor:  # pylint: disable=too-few-public-methods
         expr = expr.strip()
 
         # Simple numeric literals
-        if re.match(
-                r"^0[xX][0-9a-fA-F]+$",
-                expr) or re.match(
-                r"^\d+[kKmMgG]?$",
-                expr):
+        if _SIMPLE_HEX_RE.match(expr) or _SIMPLE_SIZE_RE.match(expr):
             return True
 
         # Simple arithmetic with only literals
-        if re.match(r"^[0-9a-fA-Fx+\-*/() \t]+$", expr):
+        if _LITERAL_ARITHMETIC_RE.match(expr):
             return True
 
         return False
@@ -1005,32 +1041,8 @@ class MemoryRegionBuilder:  # pylint: disable=too-few-public-methods
         memory_regions = {}
         failed_matches = []
 
-        # Shared lookahead: matches start of next region definition or end of block
-        _region_lookahead = (
-            r"(?=\s+\w+\s*(?:\([^)]*\)\s*)?:\s*(?:ORIGIN|origin|org)\s*=|$|\s*})"
-        )
-
-        # Try standard format first (with attributes in parentheses)
-        standard_pattern = (
-            r"(\w+)\s*\(([^)]+)\)\s*:\s*(?:ORIGIN|origin|org)\s*=\s*([^,]+),\s*"
-            r"(?:LENGTH|length|len)\s*=\s*([^,}]+?)" + _region_lookahead)
-
-        # Try ESP8266/alternative format (no attributes in parentheses)
-        alt_pattern = (
-            r"(\w+)\s*:\s*(?:ORIGIN|origin|org)\s*=\s*([^,]+),\s*"
-            r"(?:LENGTH|length|len)\s*=\s*([^,}]+?)" + _region_lookahead
-        )
-
-        # Try no-comma format (whitespace separator, used in some Intel/embedded scripts)
-        # Pattern must handle expressions with spaces (e.g., "ADDR(x) -
-        # ADDR(y)")
-        no_comma_pattern = (
-            r"(\w+)\s*:\s*(?:ORIGIN|origin|org)\s*=\s*([^\s]+(?:\s*[-+*/]\s*[^\s]+)*)\s+"
-            r"(?:LENGTH|length|len)\s*=\s*([^/\n]+?)"
-            r"(?=\s*(?://|$|\n|\w+\s*(?:\([^)]*\)\s*)?:\s*(?:ORIGIN|origin|org)\s*=))")
-
         # First try standard pattern
-        for match in re.finditer(standard_pattern, memory_content):
+        for match in _STANDARD_REGION_RE.finditer(memory_content):
             region = self._build_region_from_match(match, has_attributes=True)
             if region:
                 memory_regions[region.name] = region
@@ -1045,7 +1057,7 @@ class MemoryRegionBuilder:  # pylint: disable=too-few-public-methods
 
         # Also try alternative pattern (no attributes) for regions not yet matched
         matched_names = set(memory_regions.keys())
-        for match in re.finditer(alt_pattern, memory_content):
+        for match in _ALT_REGION_RE.finditer(memory_content):
             name = match.group(1)
             if name in matched_names:
                 continue
@@ -1064,7 +1076,7 @@ class MemoryRegionBuilder:  # pylint: disable=too-few-public-methods
 
         # Also try no-comma format for regions not yet matched
         if not memory_regions and not failed_matches:
-            for match in re.finditer(no_comma_pattern, memory_content):
+            for match in _NO_COMMA_REGION_RE.finditer(memory_content):
                 region = self._build_region_from_match(
                     match, has_attributes=False)
                 if region:
@@ -1166,7 +1178,8 @@ class LinkerScriptParser:  # pylint: disable=too-few-public-methods,too-many-ins
     """Main parser orchestrator for linker script files"""
 
     def __init__(self, ld_scripts: List[str], elf_file: Optional[str] = None,
-                 user_variables: Optional[Dict[str, Any]] = None):
+                 user_variables: Optional[Dict[str, Any]] = None,
+                 script_contents: Optional[Dict[str, str]] = None):
         """Initialize the parser with linker script paths and optional ELF file
 
         Args:
@@ -1174,10 +1187,23 @@ class LinkerScriptParser:  # pylint: disable=too-few-public-methods,too-many-ins
             elf_file: Optional path to ELF file for architecture detection
             user_variables: Optional dict of user-defined variables to use during parsing
                           (e.g., {'__micropy_flash_size__': '4096K', 'RAM_START': '0x20000000'})
+            script_contents: Optional dict mapping entries of ld_scripts to their
+                          text; these scripts are parsed from memory and need not
+                          exist on disk (GNU LD syntax only)
         """
         self.ld_scripts = [str(Path(script).resolve())
                            for script in ld_scripts]
         self.elf_file = str(Path(elf_file).resolve()) if elf_file else None
+
+        # Script text keyed by resolved path; each file is read at most once
+        # even though variable extraction and region parsing both scan it
+        self._script_contents: Dict[str, str] = {
+            str(Path(script).resolve()): content
+            for script, content in (script_contents or {}).items()
+        }
+        # Joined MEMORY block text per GNU LD script, so dependency-resolution
+        # retries don't re-resolve INCLUDEs and re-clean the whole script
+        self._memory_contents: Dict[str, str] = {}
         self._validate_scripts()
 
         # Get architecture information from ELF file if provided
@@ -1221,9 +1247,18 @@ class LinkerScriptParser:  # pylint: disable=too-few-public-methods,too-many-ins
     def _validate_scripts(self) -> None:
         """Validate that all linker scripts exist"""
         for script in self.ld_scripts:
-            if not os.path.exists(script):
+            if script not in self._script_contents and not os.path.exists(script):
                 raise FileNotFoundError(f"Linker script not found: {script}")
 
+    def _read_script(self, script_path: str) -> str:
+        """Return the text of a linker script, reading it from disk once"""
+        content = self._script_contents.get(script_path)
+        if content is None:
+            with open(script_path, "r", encoding="utf-8", errors="replace") as f:
+                content = f.read()
+            self._script_contents[script_path] = content
+        return content
+
     def parse_memory_regions(self) -> Dict[str, Dict[str, Any]]:
         """Parse memory regions from linker scripts"""
         # First pass: extract variables from all scripts
@@ -1247,8 +1282,7 @@ class LinkerScriptParser:  # pylint: disable=too-few-public-methods,too-many-ins
         self._keil_scripts = set()
         gnu_scripts = []
         for script_path in self.ld_scripts:
-            with open(script_path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
+            content = self._read_script(script_path)
             if LinkerFormatDetector.is_emproject(content):
                 self._emproject_scripts.add(script_path)
             elif LinkerFormatDetector.is_icf(content):
@@ -1260,11 +1294,13 @@ class LinkerScriptParser:  # pylint: disable=too-few-public-methods,too-many-ins
 
         # Process scripts in reverse order for proper dependency resolution
         for script_path in reversed(gnu_scripts):
-            self.variable_extractor.extract_from_script(script_path)
+            self.variable_extractor.extract_from_script(
+                script_path, self._read_script(script_path))
 
         # Additional pass: extract variables in forward order for dependencies
         for script_path in gnu_scripts:
-            self.variable_extractor.extract_from_script(script_path)
+            self.variable_extractor.extract_from_script(
+                script_path, self._read_script(script_path))
 
         # Merge extracted variables with existing default variables (preserve
         # architecture defaults)
@@ -1356,8 +1392,7 @@ class LinkerScriptParser:  # pylint: disable=too-few-public-methods,too-many-ins
             Tuple of (parsed_regions, failed_matches)
             ICF and .emProject files always return an empty failed_matches list.
         """
-        with open(script_path, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
+        content = self._read_script(script_path)
 
         # Auto-detect SEGGER ES .emProject XML and delegate
         if LinkerFormatDetector.is_emproject(content):
@@ -1372,6 +1407,19 @@ class LinkerScriptParser:  # pylint: disable=too-few-public-methods,too-many-ins
             return self._parse_keil_script(script_path), []
 
         # GNU LD path (existing logic)
+        memory_content = self._memory_block_content(script_path, content)
+        if not memory_content:
+            return {}, []
+
+        return self.region_builder.parse_memory_block(
+            memory_content, deferred_matches)
+
+    def _memory_block_content(self, script_path: str, content: str) -> str:
+        """Return the joined MEMORY block text of a GNU LD script, cached"""
+        memory_content = self._memory_contents.get(script_path)
+        if memory_content is not None:
+            return memory_content
+
         # Inline INCLUDE directives before cleaning/scanning
         content = ScriptContentCleaner.resolve_includes(
             content, os.path.dirname(os.path.abspath(script_path)))
@@ -1383,14 +1431,9 @@ class LinkerScriptParser:  # pylint: disable=too-few-public-methods,too-many-ins
         # INCLUDE chains where an outer script overrides / augments an included
         # MEMORY definition. Later definitions win for duplicate region names
         # (see parse_memory_block's dict-assignment behavior).
-        memory_blocks = re.findall(
-            r"MEMORY\s*\{([^}]+)\}", content, re.IGNORECASE)
-        if not memory_blocks:
-            return {}, []
-
-        memory_content = " ".join(memory_blocks)
-        return self.region_builder.parse_memory_block(
-            memory_content, deferred_matches)
+        memory_content = " ".join(_MEMORY_BLOCK_RE.findall(content))
+        self._memory_contents[script_path] = memory_content
+        return memory_content
 
     def _parse_icf_script(
             self,
@@ -1450,3 +1493,23 @@ def parse_linker_scripts(
     """
     parser = LinkerScriptParser(ld_scripts, elf_file)
     return parser.parse_memory_regions()
+
+
+def parse_linker_scripts_from_string(
+    content: str, name: str = "<string>"
+) -> Dict[str, Dict[str, Any]]:
+    """Parse memory regions from GNU LD linker script text held in memory
+
+    Args:
+        content: Linker script text
+        name: Logical file name used in messages; INCLUDE directives resolve
+            relative to its directory
+
+    Returns:
+        Dictionary mapping region names to region information
+
+    Raises:
+        LinkerScriptError: If parsing fails for critical regions
+    """
+    parser = LinkerScriptParser([name], script_contents={name: content})
+    return parser.parse_memory_regions()
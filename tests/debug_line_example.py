@@ -4,18 +4,83 @@
 Example of how to use .debug_line section for more accurate source file mapping
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 from elftools.elf.elffile import ELFFile
-from test_memory_analysis import TestMemoryAnalysis
+from test_memory_analysis import compiled_test_program
 
 # Add shared directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
 
+# Below this many CUs per worker, process start-up and re-reading the ELF
+# cost more than decoding the line programs serially
+MIN_CUS_PER_WORKER = 32
+
+
+def _extract_cu_line_mapping(dwarfinfo, cu, address_to_source):
+    """Add address-to-source entries from one CU's line program"""
+    line_program = dwarfinfo.line_program_for_CU(cu)
+    if line_program is None:
+        return
+
+    # Decoded filenames per file index; a CU's line program has
+    # far fewer files than entries
+    file_names = {}
+
+    # Decode the line program. Rows that repeat the previous
+    # row's address and file would rewrite the same mapping,
+    # and end_sequence rows address the byte past the sequence.
+    last_row = None
+    for entry in line_program.get_entries():
+        state = entry.state
+        if state is None or state.end_sequence:
+            continue
+        address = state.address
+        file_index = state.file
+        if not address or not file_index:
+            continue
+        row = (address, file_index)
+        if row == last_row:
+            continue
+        last_row = row
+
+        if file_index not in file_names:
+            # Get filename from the file table
+            file_entry = line_program.header.file_entry[file_index - 1]
+            # DWARF 5 entries carry only the content types the producer
+            # emitted, so 'name' may be absent
+            filename = getattr(file_entry, 'name', None)
+            if isinstance(filename, bytes):
+                filename = filename.decode('utf-8', errors='ignore')
+            file_names[file_index] = filename
+
+        filename = file_names[file_index]
+        if filename is not None:
+            address_to_source[address] = filename
+
+
+def _extract_line_mapping_for_cus(elf_path, cu_offsets):
+    """Worker: open the ELF and map the line programs of the given CUs"""
+    address_to_source = {}
+    with open(elf_path, 'rb') as f:
+        dwarfinfo = ELFFile(f).get_dwarf_info()
+        for cu_offset in cu_offsets:
+            _extract_cu_line_mapping(
+                dwarfinfo, dwarfinfo.get_CU_at(cu_offset), address_to_source)
+    return address_to_source
+
 
-def extract_line_mapping(elf_path):
-    """Extract address-to-source mapping from .debug_line section"""
+def extract_line_mapping(elf_path, max_workers=None):
+    """Extract address-to-source mapping from .debug_line section
+
+    CUs are independent, so with enough of them the line programs are
+    decoded in worker processes, each handling a contiguous run of CUs.
+    Results are merged in CU order, matching a serial pass.
+    """
     address_to_source = {}
 
     try:
@@ -26,29 +91,23 @@ def extract_line_mapping(elf_path):
                 return address_to_source
 
             dwarfinfo = elffile.get_dwarf_info()
+            cus = list(dwarfinfo.iter_CUs())
+
+            workers = min(max_workers or os.cpu_count() or 1,
+                          len(cus) // MIN_CUS_PER_WORKER)
+            if workers <= 1:
+                for cu in cus:
+                    _extract_cu_line_mapping(dwarfinfo, cu, address_to_source)
+                return address_to_source
 
-            # Iterate through line programs
-            for cu in dwarfinfo.iter_CUs(
-            ):  # pylint: disable=too-many-nested-blocks
-                line_program = dwarfinfo.line_program_for_CU(cu)
-                if line_program is None:
-                    continue
-
-                # Decode the line program
-                for entry in line_program.get_entries():
-                    # We want entries that mark the beginning of statements
-                    if entry.state and hasattr(
-                            entry.state, 'address') and entry.state.address:
-                        if hasattr(entry.state, 'file') and entry.state.file:
-                            # Get filename from the file table
-                            file_entry = line_program.header.file_entry[entry.state.file - 1]
-                            if hasattr(file_entry, 'name'):
-                                filename = file_entry.name
-                                if isinstance(filename, bytes):
-                                    filename = filename.decode(
-                                        'utf-8', errors='ignore')
-
-                                address_to_source[entry.state.address] = filename
+        cu_offsets = [cu.cu_offset for cu in cus]
+        chunk_size = -(-len(cu_offsets) // workers)
+        chunks = [cu_offsets[i:i + chunk_size]
+                  for i in range(0, len(cu_offsets), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for mapping in executor.map(
+                    _extract_line_mapping_for_cus, repeat(elf_path), chunks):
+                address_to_source.update(mapping)
 
     except (OSError, IOError) as e:
         print(f"Error parsing .debug_line: {e}")
@@ -59,38 +118,33 @@ def extract_line_mapping(elf_path):
 def demo_line_mapping():
     """Demonstrate .debug_line based source mapping"""
     # Generate test ELF file
-    test = TestMemoryAnalysis()
-    test.setUp()
-    test.test_02_compile_test_program()
-
-    elf_file = test.temp_dir / 'simple_program.elf'
-
-    # Extract line mapping
-    line_mapping = extract_line_mapping(str(elf_file))
-
-    print(
-        f"Found {len(line_mapping)} address-to-source mappings from .debug_line")
-
-    # Show some examples
-    print("\nSample mappings:")
-    for i, (addr, source) in enumerate(line_mapping.items()):
-        if i < 10:  # Show first 10
-            print(f"  0x{addr:08x} -> {source}")
-
-    # Check specific addresses we know about
-    print("\nUART function addresses from our earlier debug:")
-    known_addresses = [
-        (0x08000258, "uart_init"),
-        (0x0800028d, "uart_transmit"),
-        (0x080002f3, "uart_receive"),
-        (0x08000378, "uart_get_status")
-    ]
-
-    for addr, func_name in known_addresses:
-        if addr in line_mapping:
-            print(f"  {func_name:15} @ 0x{addr:08x} -> {line_mapping[addr]}")
-        else:
-            print(f"  {func_name:15} @ 0x{addr:08x} -> NOT FOUND in .debug_line")
+    with compiled_test_program() as elf_file:
+        # Extract line mapping
+        line_mapping = extract_line_mapping(str(elf_file))
+
+        print(
+            f"Found {len(line_mapping)} address-to-source mappings from .debug_line")
+
+        # Show some examples
+        print("\nSample mappings:")
+        for i, (addr, source) in enumerate(line_mapping.items()):
+            if i < 10:  # Show first 10
+                print(f"  0x{addr:08x} -> {source}")
+
+        # Check specific addresses we know about
+        print("\nUART function addresses from our earlier debug:")
+        known_addresses = [
+            (0x08000258, "uart_init"),
+            (0x0800028d, "uart_transmit"),
+            (0x080002f3, "uart_receive"),
+            (0x08000378, "uart_get_status")
+        ]
+
+        for addr, func_name in known_addresses:
+            if addr in line_mapping:
+                print(f"  {func_name:15} @ 0x{addr:08x} -> {line_mapping[addr]}")
+            else:
+                print(f"  {func_name:15} @ 0x{addr:08x} -> NOT FOUND in .debug_line")
 
 
 if __name__ == '__main__':
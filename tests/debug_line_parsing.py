@@ -4,121 +4,130 @@
 Debug why .debug_line parsing isn't working
 """
 
+import logging
+import mmap
 import sys
 import traceback
 from pathlib import Path
 
 from elftools.elf.elffile import ELFFile
-from test_memory_analysis import TestMemoryAnalysis
+from test_memory_analysis import compiled_test_program
 
 # Add shared directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
 
+logger = logging.getLogger(__name__)
 
-def debug_line_parsing():  # pylint: disable=too-many-locals,too-many-statements
-    """Debug the .debug_line parsing"""
-
-    # Generate test ELF file
-    test = TestMemoryAnalysis()
-    test.setUp()
-    test.test_02_compile_test_program()
-
-    elf_file = test.temp_dir / 'simple_program.elf'
-    print(f"Debugging line parsing for: {elf_file}")
-
-    try:
-        with open(elf_file, 'rb') as f:
-            elffile = ELFFile(f)
-
-            if not elffile.has_dwarf_info():
-                print("❌ No DWARF info found")
-                return
-
-            print("✅ DWARF info found")
-            dwarfinfo = elffile.get_dwarf_info()
-
-            cu_count = 0
-            for cu in dwarfinfo.iter_CUs(
-            ):  # pylint: disable=too-many-nested-blocks
-                cu_count += 1
-                top_die = cu.get_top_DIE()
-
-                # Check compilation directory
-                comp_dir_attr = top_die.attributes.get('DW_AT_comp_dir')
-                comp_dir = comp_dir_attr.value.decode(
-                    'utf-8', errors='ignore') if comp_dir_attr else ""
-                print(f"\nCU {cu_count}: comp_dir = '{comp_dir}'")
-
-                # Check line program
-                lineprog = dwarfinfo.line_program_for_CU(cu)
-                if not lineprog:
-                    print("  ❌ No line program for this CU")
-                    continue
-
-                print("  ✅ Line program found")
-
-                # Debug file and directory access
-                try:
-                    file_entries = (lineprog['file_entry']
-                                    if 'file_entry' in lineprog
-                                    else lineprog.header.file_entry)
-                    include_dirs = (lineprog['include_directory']
-                                    if 'include_directory' in lineprog
-                                    else lineprog.header.include_directory)
-
-                    print(f"    Files: {len(file_entries)}")
-                    print(f"    Include dirs: {len(include_dirs)}")
-
-                    # Show file entries
-                    for i, file_entry in enumerate(file_entries):
-                        filename = file_entry.name
-                        if isinstance(filename, bytes):
-                            filename = filename.decode(
-                                'utf-8', errors='ignore')
-                        dir_index = getattr(file_entry, 'dir_index', 'N/A')
-                        print(
-                            f"      File {i+1}: {filename} (dir_index: {dir_index})")
 
-                    # Process line program entries
-                    entry_count = 0
-                    valid_entries = 0
+def _file_name(file_entries, file_index, file_names):
+    """Decode the name of a 1-based file table entry, caching per index"""
+    filename = file_names.get(file_index)
+    if filename is None:
+        filename = file_entries[file_index - 1].name
+        if isinstance(filename, bytes):
+            filename = filename.decode('utf-8', errors='ignore')
+        file_names[file_index] = filename
+    return filename
 
-                    for entry in lineprog.get_entries():
-                        entry_count += 1
-                        if entry.state is None:
-                            continue
 
-                        state = entry.state
+def debug_line_parsing():  # pylint: disable=too-many-locals,too-many-statements
+    """Debug the .debug_line parsing"""
 
-                        # Check what we have
-                        has_address = hasattr(
-                            state, 'address') and state.address is not None
-                        has_file = hasattr(
-                            state, 'file') and state.file is not None and state.file > 0
-                        is_end_seq = getattr(state, 'end_sequence', False)
+    # Generate test ELF file
+    with compiled_test_program() as elf_file:
+        print(f"Debugging line parsing for: {elf_file}")
+
+        try:
+            with open(elf_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                elffile = ELFFile(mapped)
+
+                if not elffile.has_dwarf_info():
+                    print("❌ No DWARF info found")
+                    return
+
+                print("✅ DWARF info found")
+                dwarfinfo = elffile.get_dwarf_info()
+
+                cu_count = 0
+                for cu in dwarfinfo.iter_CUs(
+                ):  # pylint: disable=too-many-nested-blocks
+                    cu_count += 1
+                    top_die = cu.get_top_DIE()
+
+                    # Check compilation directory
+                    comp_dir_attr = top_die.attributes.get('DW_AT_comp_dir')
+                    comp_dir = comp_dir_attr.value.decode(
+                        'utf-8', errors='ignore') if comp_dir_attr else ""
+                    print(f"\nCU {cu_count}: comp_dir = '{comp_dir}'")
+
+                    # Check line program
+                    lineprog = dwarfinfo.line_program_for_CU(cu)
+                    if not lineprog:
+                        print("  ❌ No line program for this CU")
+                        continue
+
+                    print("  ✅ Line program found")
+
+                    # Debug file and directory access
+                    try:
+                        file_entries = lineprog.header.file_entry
+                        include_dirs = lineprog.header.include_directory
+
+                        print(f"    Files: {len(file_entries)}")
+                        print(f"    Include dirs: {len(include_dirs)}")
+
+                        # File names are decoded on first reference only; CUs
+                        # often list many headers no line entry points at
+                        file_names = {}
+
+                        # Process line program entries
+                        entry_count = 0
+                        valid_entries = 0
+                        referenced_files = set()
+
+                        for entry in lineprog.get_entries():
+                            entry_count += 1
+                            state = entry.state
+                            if state is None:
+                                continue
+
+                            # LineState always carries these fields
+                            address = state.address
+                            file_index = state.file
+                            if state.end_sequence or address is None or not file_index:
+                                continue
 
-                        if not is_end_seq and has_address and has_file:
                             valid_entries += 1
+                            referenced_files.add(file_index)
                             if valid_entries <= 5:  # Show first 5
-                                file_entry = file_entries[state.file - 1]
-                                filename = file_entry.name
-                                if isinstance(filename, bytes):
-                                    filename = filename.decode(
-                                        'utf-8', errors='ignore')
+                                filename = _file_name(
+                                    file_entries, file_index, file_names)
                                 print(
-                                    f"      Entry: addr=0x{state.address:x}, "
-                                    f"file={state.file} ({filename})")
-
-                    print(
-                        f"    Total entries: {entry_count}, Valid: {valid_entries}")
+                                    f"      Entry: addr=0x{address:x}, "
+                                    f"file={file_index} ({filename})")
 
-                except (OSError, IOError, AttributeError, ValueError) as e:
-                    print(f"    ❌ Error processing entries: {e}")
-                    traceback.print_exc()
-
-    except (OSError, IOError, AttributeError) as e:
-        print(f"❌ Error: {e}")
-        traceback.print_exc()
+                        print(
+                            f"    Total entries: {entry_count}, Valid: {valid_entries}")
+
+                        # Show the file entries line entries actually refer to
+                        print(f"    Referenced files: {len(referenced_files)}")
+                        for file_index in sorted(referenced_files):
+                            file_entry = file_entries[file_index - 1]
+                            dir_index = getattr(file_entry, 'dir_index', 'N/A')
+                            filename = _file_name(file_entries, file_index, file_names)
+                            print(
+                                f"      File {file_index}: {filename} (dir_index: {dir_index})")
+
+                    except (OSError, IOError, AttributeError, ValueError) as e:
+                        # Keep going with the next CU; the stack is only worth
+                        # formatting when debug logging is on
+                        print(f"    ❌ Error processing entries: {e}")
+                        logger.debug("Skipped CU %d", cu_count, exc_info=True)
+
+        except (OSError, IOError, AttributeError) as e:
+            print(f"❌ Error: {e}")
+            traceback.print_exc()
 
 
 if __name__ == '__main__':
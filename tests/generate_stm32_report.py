@@ -16,23 +16,90 @@ from pathlib import Path
 from membrowse.linker.parser import parse_linker_scripts
 from tests.test_utils import validate_memory_regions
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add shared directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
 
 
-def generate_stm32_report(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
-        target_name='NUCLEO_F401RE_basic',
-        output_file='stm32_memory_report.json'):
-    """Generate memory report for specified STM32 target"""
-
-    # Load metadata
+def _region_statistics(parsed_regions):
+    """Count and size FLASH/ROM and RAM regions in a single pass"""
+    flash_regions = ram_regions = total_flash_size = total_ram_size = 0
+    for region in parsed_regions.values():
+        region_type = region.get('type', '').upper()
+        if region_type in ('FLASH', 'ROM'):
+            flash_regions += 1
+            total_flash_size += region.get('limit_size', 0)
+        elif region_type == 'RAM':
+            ram_regions += 1
+            total_ram_size += region.get('limit_size', 0)
+
+    return {
+        'total_regions': len(parsed_regions),
+        'flash_regions': flash_regions,
+        'ram_regions': ram_regions,
+        'total_flash_size': total_flash_size,
+        'total_ram_size': total_ram_size,
+    }
+
+
+def _load_metadata():
+    """Load the MicroPython linker metadata, or None if it is missing"""
     metadata_file = Path("../../micropython/linker_metadata.json")
     if not metadata_file.exists():
         print(f"ERROR: Metadata file not found: {metadata_file}")
-        return False
+        return None
 
     with open(metadata_file, 'r', encoding='utf-8') as f:
-        metadata = json.load(f)
+        return json.load(f)
+
+
+def generate_stm32_reports(targets, output_dir='.'):
+    """Generate memory reports for several STM32 targets.
+
+    The metadata is loaded once, and targets sharing the same linker
+    scripts reuse one parse.
+
+    Returns:
+        Dictionary mapping each target name to its success flag
+    """
+    metadata = _load_metadata()
+    if metadata is None:
+        return {target_name: False for target_name in targets}
+
+    parse_cache = {}
+    return {
+        target_name: generate_stm32_report(
+            target_name,
+            str(Path(output_dir) / f'{target_name}_memory_report.json'),
+            metadata=metadata,
+            parse_cache=parse_cache)
+        for target_name in targets
+    }
+
+
+def generate_stm32_report(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        target_name='NUCLEO_F401RE_basic',
+        output_file='stm32_memory_report.json',
+        metadata=None,
+        parse_cache=None):
+    """Generate memory report for specified STM32 target
+
+    Args:
+        target_name: STM32 target in the linker metadata
+        output_file: Path to write the JSON report to
+        metadata: Preloaded linker metadata (loaded from disk if None)
+        parse_cache: Optional dict caching parsed regions by script paths
+    """
+
+    # Load metadata
+    if metadata is None:
+        metadata = _load_metadata()
+        if metadata is None:
+            return False
 
     # Get STM32 configurations
     stm32_configs = metadata.get('stm32', {})
@@ -72,7 +139,13 @@ def generate_stm32_report(  # pylint: disable=too-many-locals,too-many-branches,
     # Parse linker scripts
     try:
         print("Parsing linker scripts...")
-        parsed_regions = parse_linker_scripts(valid_scripts)
+        cache_key = tuple(valid_scripts)
+        if parse_cache is not None and cache_key in parse_cache:
+            parsed_regions = parse_cache[cache_key]
+        else:
+            parsed_regions = parse_linker_scripts(valid_scripts)
+            if parse_cache is not None:
+                parse_cache[cache_key] = parsed_regions
         print(f"Successfully parsed {len(parsed_regions)} memory regions")
 
         # Validate regions
@@ -101,31 +174,17 @@ def generate_stm32_report(  # pylint: disable=too-many-locals,too-many-branches,
             'memory_regions': parsed_regions,
             'expected_regions': expected_regions,
             'validation': validation_result,
-            'statistics': {
-                'total_regions': len(parsed_regions),
-                'flash_regions': len([
-                    r for r in parsed_regions.values()
-                    if r.get('type', '').upper() in ['FLASH', 'ROM']
-                ]),
-                'ram_regions': len([
-                    r for r in parsed_regions.values()
-                    if r.get('type', '').upper() == 'RAM'
-                ]),
-                'total_flash_size': sum(
-                    r.get('limit_size', 0) for r in parsed_regions.values()
-                    if r.get('type', '').upper() in ['FLASH', 'ROM']
-                ),
-                'total_ram_size': sum(
-                    r.get('limit_size', 0) for r in parsed_regions.values()
-                    if r.get('type', '').upper() == 'RAM'
-                )
-            }
+            'statistics': _region_statistics(parsed_regions)
         }
 
         # Save report
         output_path = Path(output_file)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            output_path.write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
 
         print(f"✅ Memory report saved to: {output_path}")
 
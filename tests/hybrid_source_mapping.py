@@ -5,17 +5,67 @@ Demonstration of a hybrid approach for source file mapping that combines
 .debug_line (for functions) with DIE analysis (for variables and context)
 """
 
+import bisect
+import mmap
+import os
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 from elftools.elf.elffile import ELFFile
-from test_memory_analysis import TestMemoryAnalysis
+from test_memory_analysis import compiled_test_program
 
 # Add shared directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
 
-
-class HybridSourceMapper:  # pylint: disable=too-few-public-methods
+# Below this many CUs per worker, process start-up and re-reading the ELF
+# cost more than decoding the line programs serially
+MIN_CUS_PER_WORKER = 32
+
+
+def _map_line_program(line_program, line_mapping):
+    """Add address-to-source entries from one line program"""
+    file_entries = line_program.header.file_entry
+    # Decoded filenames per file index, filled on first use
+    file_names = {}
+
+    for entry in line_program.get_entries():
+        state = entry.state
+        if state is None or state.end_sequence:
+            continue
+        address = state.address
+        file_index = state.file
+        if not address or not file_index:
+            continue
+
+        if file_index not in file_names:
+            filename = getattr(file_entries[file_index - 1], 'name', None)
+            if isinstance(filename, bytes):
+                filename = filename.decode('utf-8', errors='ignore')
+            file_names[file_index] = filename
+
+        filename = file_names[file_index]
+        if filename is not None:
+            line_mapping[address] = filename
+
+
+def _decode_line_programs(elf_path, cu_offsets):
+    """Worker: open the ELF and map the line programs of the given CUs"""
+    line_mapping = {}
+    with open(elf_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        dwarfinfo = ELFFile(mapped).get_dwarf_info()
+        for cu_offset in cu_offsets:
+            line_program = dwarfinfo.line_program_for_CU(
+                dwarfinfo.get_CU_at(cu_offset))
+            if line_program is not None:
+                _map_line_program(line_program, line_mapping)
+    return line_mapping
+
+
+class HybridSourceMapper:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """
     Hybrid source file mapper that uses:
     1. .debug_line for function addresses (most reliable)
@@ -23,49 +73,186 @@ class HybridSourceMapper:  # pylint: disable=too-few-public-methods
     3. Intelligent fallbacks for edge cases
     """
 
-    def __init__(self, elf_path):
+    def __init__(self, elf_path, symbol_addresses=None, max_workers=None):
         self.elf_path = elf_path
-        self.line_mapping = {}  # address -> source file from .debug_line
+        # Upper bound on line program decode processes (None: CPU count)
+        self.max_workers = max_workers
+        # Sorted addresses of the symbols of interest; None maps every CU
+        self.symbol_addresses = (sorted(set(symbol_addresses))
+                                 if symbol_addresses is not None else None)
+        # .debug_line mapping stored column-wise: sorted addresses, and per
+        # address an index into a table of distinct source file names
+        self._line_addresses = array('Q')
+        self._line_file_ids = array('I')
+        self._file_table = []
         # (symbol_name, address) -> source file from DIEs
         self.die_mapping = {}
         self.cu_context = {}    # address_range -> cu_source_file
 
-        self._build_line_mapping()
+        self._store_line_mapping(self._build_line_mapping())
         self._build_die_mapping()
 
+    @property
+    def line_count(self):
+        """Number of addresses mapped from .debug_line"""
+        return len(self._line_addresses)
+
+    def line_source(self, address):
+        """Source file .debug_line maps an exact address to, or None"""
+        idx = bisect.bisect_left(self._line_addresses, address)
+        if idx < len(self._line_addresses) and self._line_addresses[idx] == address:
+            return self._file_table[self._line_file_ids[idx]]
+        return None
+
+    def _store_line_mapping(self, line_mapping):
+        """Pack an address -> file dict into the sorted column storage.
+
+        Tens of thousands of line addresses typically share a few hundred
+        file names, so each address keeps a 4-byte file id instead of a
+        dict slot and string reference.
+        """
+        file_ids = {}
+        for address in sorted(line_mapping):
+            filename = line_mapping[address]
+            file_id = file_ids.get(filename)
+            if file_id is None:
+                file_id = file_ids[filename] = len(self._file_table)
+                self._file_table.append(filename)
+            self._line_addresses.append(address)
+            self._line_file_ids.append(file_id)
+
+    def _contains_symbol(self, low_pc, high_pc):
+        """Check whether any symbol of interest lies in [low_pc, high_pc)"""
+        idx = bisect.bisect_left(self.symbol_addresses, low_pc)
+        return (idx < len(self.symbol_addresses)
+                and self.symbol_addresses[idx] < high_pc)
+
+    def _aranges_cu_offsets(self, dwarfinfo):
+        """Classify CUs by the .debug_aranges table.
+
+        Returns:
+            (covered, relevant) sets of CU offsets: CUs listed in the table,
+            and those among them with a range holding a symbol of interest.
+            Both are empty when the section is absent.
+        """
+        covered = set()
+        relevant = set()
+        if self.symbol_addresses is None:
+            return covered, relevant
+
+        aranges = dwarfinfo.get_aranges()
+        if aranges is None:
+            return covered, relevant
+
+        for arange in aranges.entries:
+            covered.add(arange.info_offset)
+            if arange.info_offset not in relevant and self._contains_symbol(
+                    arange.begin_addr, arange.begin_addr + arange.length):
+                relevant.add(arange.info_offset)
+        return covered, relevant
+
+    def _cu_has_symbols(self, cu):
+        """Check whether a CU's address range contains any symbol of interest.
+
+        CUs without a contiguous low_pc/high_pc range (e.g. DW_AT_ranges)
+        are always treated as relevant.
+        """
+        if self.symbol_addresses is None:
+            return True
+
+        attrs = cu.get_top_DIE().attributes
+        low_pc_attr = attrs.get('DW_AT_low_pc')
+        high_pc_attr = attrs.get('DW_AT_high_pc')
+        if (low_pc_attr is None or high_pc_attr is None
+                or low_pc_attr.form != 'DW_FORM_addr'):
+            return True
+
+        low_pc = low_pc_attr.value
+        high_pc = high_pc_attr.value
+        # DWARF 4+ encodes high_pc as an offset from low_pc
+        if high_pc_attr.form != 'DW_FORM_addr':
+            high_pc += low_pc
+
+        return self._contains_symbol(low_pc, high_pc)
+
+    def _select_cus(self, dwarfinfo):
+        """List the CUs whose line programs need decoding, in CU order"""
+        # DW_AT_stmt_list offsets already selected; CUs can share a
+        # line program (e.g. DWZ-compressed debug info)
+        selected_stmt_lists = set()
+        # .debug_aranges answers relevance without touching the CU's
+        # DIEs; CUs missing from it fall back to their top DIE range
+        aranges_covered, aranges_relevant = self._aranges_cu_offsets(dwarfinfo)
+        cus = []
+
+        for cu in dwarfinfo.iter_CUs():
+            if cu.cu_offset in aranges_covered:
+                if cu.cu_offset not in aranges_relevant:
+                    continue
+            elif not self._cu_has_symbols(cu):
+                continue
+
+            stmt_list_attr = cu.get_top_DIE().attributes.get('DW_AT_stmt_list')
+            if stmt_list_attr is not None:
+                if stmt_list_attr.value in selected_stmt_lists:
+                    continue
+                selected_stmt_lists.add(stmt_list_attr.value)
+
+            cus.append(cu)
+        return cus
+
     def _build_line_mapping(self):
-        """Build address-to-source mapping from .debug_line section"""
+        """Build address-to-source mapping from .debug_line section
+
+        CUs are independent, so with enough relevant ones their line
+        programs are decoded in worker processes, each handling a
+        contiguous run of CUs. Results are merged in CU order, matching
+        a serial pass.
+
+        Returns:
+            Dictionary mapping line addresses to source file names
+        """
+        line_mapping = {}
         try:
-            with open(self.elf_path, 'rb') as f:
-                elffile = ELFFile(f)
+            # pyelftools only needs read/seek/tell, so the ELF is read
+            # through a read-only mapping instead of buffered file reads
+            with open(self.elf_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                elffile = ELFFile(mapped)
 
                 if not elffile.has_dwarf_info():
-                    return
+                    return line_mapping
 
                 dwarfinfo = elffile.get_dwarf_info()
+                cus = self._select_cus(dwarfinfo)
 
-                for cu in dwarfinfo.iter_CUs():
-                    line_program = dwarfinfo.line_program_for_CU(cu)
-                    if line_program is None:
-                        continue
-
-                    for entry in line_program.get_entries():
-                        if (entry.state and hasattr(entry.state, 'address') and
-                            entry.state.address and hasattr(entry.state, 'file') and
-                                entry.state.file):
+                workers = min(self.max_workers or os.cpu_count() or 1,
+                              len(cus) // MIN_CUS_PER_WORKER)
+                if workers <= 1:
+                    for cu in cus:
+                        line_program = dwarfinfo.line_program_for_CU(cu)
+                        if line_program is not None:
+                            _map_line_program(line_program, line_mapping)
+                    return line_mapping
 
-                            file_entry = line_program.header.file_entry[entry.state.file - 1]
-                            if hasattr(file_entry, 'name'):
-                                filename = file_entry.name
-                                if isinstance(filename, bytes):
-                                    filename = filename.decode(
-                                        'utf-8', errors='ignore')
-
-                                self.line_mapping[entry.state.address] = filename
+            self._decode_in_workers(
+                [cu.cu_offset for cu in cus], workers, line_mapping)
 
         except (OSError, IOError, AttributeError) as e:
             print(f"Error building line mapping: {e}")
 
+        return line_mapping
+
+    def _decode_in_workers(self, cu_offsets, workers, line_mapping):
+        """Decode CU line programs in contiguous runs across worker processes"""
+        chunk_size = -(-len(cu_offsets) // workers)
+        chunks = [cu_offsets[i:i + chunk_size]
+                  for i in range(0, len(cu_offsets), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for mapping in executor.map(
+                    _decode_line_programs, repeat(self.elf_path), chunks):
+                line_mapping.update(mapping)
+
     def _build_die_mapping(self):
         """Build symbol mapping from DIE analysis (our existing logic)"""
         # This would use our existing DIE-based logic
@@ -82,16 +269,17 @@ class HybridSourceMapper:  # pylint: disable=too-few-public-methods
 
         if symbol_type == 'FUNC':
             # Functions: Prefer .debug_line
-            if symbol_address in self.line_mapping:
-                source_file = self.line_mapping[symbol_address]
+            source_file = self.line_source(symbol_address)
+            if source_file is not None:
                 return self._extract_basename(source_file)
 
-            # Fallback: Search nearby addresses in case of slight misalignment
-            for offset in range(-10, 11):
-                check_addr = symbol_address + offset
-                if check_addr in self.line_mapping:
-                    source_file = self.line_mapping[check_addr]
-                    return self._extract_basename(source_file)
+            # Fallback: Search nearby addresses in case of slight misalignment,
+            # taking the lowest line address within 10 bytes
+            idx = bisect.bisect_left(self._line_addresses, symbol_address - 10)
+            if (idx < len(self._line_addresses)
+                    and self._line_addresses[idx] <= symbol_address + 10):
+                source_file = self._file_table[self._line_file_ids[idx]]
+                return self._extract_basename(source_file)
 
         elif symbol_type == 'OBJECT':
             # Variables: Must use DIE analysis (no choice)
@@ -109,47 +297,49 @@ class HybridSourceMapper:  # pylint: disable=too-few-public-methods
         """Extract just the filename from a full path"""
         if not filepath:
             return ""
-        return Path(filepath).name
+        # Called per symbol; a string scan avoids building a Path. Both
+        # separators are accepted since DWARF from Windows hosts uses '\\'.
+        separator = max(filepath.rfind('/'), filepath.rfind('\\'))
+        return filepath[separator + 1:]
 
 
 def demo_hybrid_approach():
     """Demonstrate the hybrid approach"""
-    test = TestMemoryAnalysis()
-    test.setUp()
-    test.test_02_compile_test_program()
-
-    elf_file = test.temp_dir / 'simple_program.elf'
-    mapper = HybridSourceMapper(str(elf_file))
-
-    print("Hybrid Source Mapping Demonstration")
-    print("=" * 50)
-
-    print(f"\n.debug_line mappings found: {len(mapper.line_mapping)}")
-
-    # Test with our known symbols
-    from membrowse.core import ELFAnalyzer  # pylint: disable=import-outside-toplevel
-    analyzer = ELFAnalyzer(str(elf_file))
-    symbols = analyzer.get_symbols()
-
-    print("\nFunction symbols (can use .debug_line):")
-    for symbol in symbols:
-        if symbol.type == 'FUNC' and 'uart' in symbol.name.lower():
-            line_result = mapper.line_mapping.get(symbol.address, "NOT FOUND")
-            print(f"  {symbol.name:15} @ 0x{symbol.address:08x}")
-            print(f"    .debug_line: {line_result}")
-            print(f"    DIE result:  {symbol.source_file}")
-            print()
-
-    print("Variable symbols (must use DIE analysis):")
-    for symbol in symbols:
-        if symbol.type == 'OBJECT' and 'uart' in symbol.name.lower():
-            line_result = mapper.line_mapping.get(symbol.address, "NOT FOUND")
-            print(f"  {symbol.name:15} @ 0x{symbol.address:08x}")
-            print(
-                f"    .debug_line: {line_result} "
-                "(expected - variables not in line info)")
-            print(f"    DIE result:  {symbol.source_file}")
-            print()
+    with compiled_test_program() as elf_file:
+        # Only CUs holding these symbols need their line programs decoded
+        from membrowse.core import ELFAnalyzer  # pylint: disable=import-outside-toplevel
+        analyzer = ELFAnalyzer(str(elf_file))
+        symbols = analyzer.get_symbols()
+        mapper = HybridSourceMapper(
+            str(elf_file), symbol_addresses=[symbol.address for symbol in symbols])
+
+        print("Hybrid Source Mapping Demonstration")
+        print("=" * 50)
+
+        print(f"\n.debug_line mappings found: {mapper.line_count}")
+
+        # Lower-case each name once; both listings below draw from this subset
+        uart_symbols = [symbol for symbol in symbols if 'uart' in symbol.name.lower()]
+
+        print("\nFunction symbols (can use .debug_line):")
+        for symbol in uart_symbols:
+            if symbol.type == 'FUNC':
+                line_result = mapper.line_source(symbol.address) or "NOT FOUND"
+                print(f"  {symbol.name:15} @ 0x{symbol.address:08x}")
+                print(f"    .debug_line: {line_result}")
+                print(f"    DIE result:  {symbol.source_file}")
+                print()
+
+        print("Variable symbols (must use DIE analysis):")
+        for symbol in uart_symbols:
+            if symbol.type == 'OBJECT':
+                line_result = mapper.line_source(symbol.address) or "NOT FOUND"
+                print(f"  {symbol.name:15} @ 0x{symbol.address:08x}")
+                print(
+                    f"    .debug_line: {line_result} "
+                    "(expected - variables not in line info)")
+                print(f"    DIE result:  {symbol.source_file}")
+                print()
 
 
 if __name__ == '__main__':
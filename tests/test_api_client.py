@@ -0,0 +1,88 @@
+"""Tests for the MemBrowse API client upload payload."""
+
+import gzip
+import json
+from unittest.mock import patch
+
+from membrowse.api.client import MemBrowseClient, _encode_json
+from membrowse.auth.strategy import AuthContext, AuthType
+
+
+def _report():
+    return {
+        'metadata': {'git': {'commit_hash': 'abc123'}, 'target_name': 'stm32'},
+        'memory_analysis': {'symbols': [{'name': 'main', 'size': 4}]},
+    }
+
+
+def _sent_payload(mock_request):
+    kwargs = mock_request.call_args.kwargs
+    body = kwargs['data']
+    if kwargs['headers'].get('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+class TestUploadReport:
+    """Test MemBrowseClient.upload_report payload construction."""
+
+    @patch.object(MemBrowseClient, '_request_with_retry', return_value={'success': True})
+    def test_api_key_payload_is_report(self, mock_request):
+        """API key uploads send the report as-is."""
+        client = MemBrowseClient(
+            AuthContext(auth_type=AuthType.API_KEY, api_key='key'),
+            'https://api.example.com/')
+        report = _report()
+
+        client.upload_report(report)
+
+        assert mock_request.call_args.args == ('POST', 'https://api.example.com/upload')
+        assert mock_request.call_args.kwargs['log_context'] == 'abc123'
+        assert _sent_payload(mock_request) == _report()
+
+    @patch.object(MemBrowseClient, '_request_with_retry', return_value={'success': True})
+    def test_tokenless_metadata_added_without_mutating_input(self, mock_request):
+        """Tokenless uploads add github_context to metadata but leave the
+        caller's report untouched."""
+        client = MemBrowseClient(
+            AuthContext(auth_type=AuthType.GITHUB_TOKENLESS,
+                        github_context={'pr_number': 7}),
+            'https://api.example.com')
+        report = _report()
+
+        client.upload_report(report)
+
+        sent = _sent_payload(mock_request)
+        assert sent['metadata']['github_context'] == {'pr_number': 7}
+        assert sent['metadata']['target_name'] == 'stm32'
+        assert sent['memory_analysis'] == report['memory_analysis']
+        assert report == _report()
+
+    @patch.object(MemBrowseClient, '_request_with_retry', return_value={'success': True})
+    def test_compression_can_be_disabled(self, mock_request):
+        """Uploads are gzipped by default; compress=False sends plain JSON."""
+        auth = AuthContext(auth_type=AuthType.API_KEY, api_key='key')
+
+        MemBrowseClient(auth, 'https://api.example.com').upload_report(_report())
+        headers = mock_request.call_args.kwargs['headers']
+        assert headers['Content-Encoding'] == 'gzip'
+        assert headers['Content-Type'] == 'application/json'
+        assert _sent_payload(mock_request) == _report()
+
+        MemBrowseClient(auth, 'https://api.example.com',
+                        compress=False).upload_report(_report())
+        assert 'Content-Encoding' not in mock_request.call_args.kwargs['headers']
+        assert json.loads(mock_request.call_args.kwargs['data']) == _report()
+
+
+class TestEncodeJson:  # pylint: disable=too-few-public-methods
+    """Test upload payload serialization with and without orjson."""
+
+    def test_stdlib_fallback_matches_orjson(self):
+        """Both encoders produce equivalent JSON, including int dict keys."""
+        data = {'memory_layout': {'FLASH': {'used_size': 10}}, 'counts': {1: 2},
+                'name': 'caf\u00e9'}
+        with patch('membrowse.api.client.orjson', None):
+            fallback = _encode_json(data)
+        assert json.loads(fallback) == json.loads(_encode_json(data))
+        assert json.loads(fallback)['counts'] == {'1': 2}
@@ -9,7 +9,6 @@ and applies appropriate parsing strategies.
 # pylint: disable=duplicate-code
 
 import os
-import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -20,9 +19,6 @@ from membrowse.linker.elf_info import (
 )
 from membrowse.linker.parser import LinkerScriptParser, parse_linker_scripts
 
-# Add shared directory to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
-
 
 class TestELFArchitectureDetection(unittest.TestCase):
     """Test ELF architecture detection functionality"""
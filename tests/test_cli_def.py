@@ -9,17 +9,11 @@ parsed and passed to the parser.
 """
 
 import os
-import sys
 import tempfile
 import unittest
 import argparse
-from pathlib import Path
 from unittest.mock import patch
 
-# Add shared directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
-
-# pylint: disable=wrong-import-position
 from membrowse.commands.report import add_report_parser, run_report
 from membrowse.commands.onboard import add_onboard_parser
 
@@ -4,25 +4,29 @@ import platform
 import shutil
 import subprocess
 import time
-from typing import List
+from typing import List, Optional
 
 
-def run_compilation(compile_cmd: List[str], success_msg: str = "Compilation successful") -> None:
+def run_compilation(compile_cmd: List[str], success_msg: str = "Compilation successful",
+                    timeout: Optional[float] = None) -> None:
     """
     Run a compilation command and handle errors.
 
     Args:
         compile_cmd: List of command arguments to pass to subprocess.run
         success_msg: Message to print on successful compilation
+        timeout: Seconds to wait for the compiler before giving up
 
     Raises:
         subprocess.CalledProcessError: If compilation fails
+        subprocess.TimeoutExpired: If the compiler runs past timeout
     """
     result = subprocess.run(
         compile_cmd,
         capture_output=True,
         text=True,
-        check=True
+        check=True,
+        timeout=timeout
     )
     print(success_msg)
     if result.stderr:
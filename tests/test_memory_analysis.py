@@ -10,12 +10,17 @@ This script:
 4. Verifies the report contents match expectations
 """
 
+import contextlib
+import functools
+import hashlib
 import json
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from membrowse.core import ReportGenerator
@@ -29,254 +34,339 @@ try:
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
 
-# Add shared directory to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
+# Upper bounds, in seconds, so a hung tool fails its test instead of
+# stalling the whole suite
+PROBE_TIMEOUT = 5
+COMPILE_TIMEOUT = 30
+BLOATY_TIMEOUT = 60
+
+# Builds of simple_program are kept across runs, keyed by their inputs, in
+# this checkout's pytest cache (the path config.cache.mkdir would give), so
+# the cache belongs to whoever owns the checkout and --cache-clear drops it
+_ELF_CACHE_DIR = (Path(__file__).resolve().parent.parent
+                  / '.pytest_cache' / 'd' / 'membrowse-test-elf')
+
+# Resolved with a PATH lookup so runners without the tools skip the
+# dependent tests before anything is forked
+HAS_GCC = bool(shutil.which('gcc') or shutil.which('arm-none-eabi-gcc'))
+HAS_BLOATY = shutil.which('bloaty') is not None
+
+_TEST_DIR = Path(__file__).resolve().parent
+_C_FILE = _TEST_DIR / 'simple_program.c'
+_LD_FILE = _TEST_DIR / 'simple_program.ld'
+
+# Regions declared in simple_program.ld
+_EXPECTED_REGIONS = {
+    'FLASH': {'address': 0x08000000, 'limit_size': 512 * 1024, 'attributes': 'rx'},
+    'RAM': {'address': 0x20000000, 'limit_size': 128 * 1024, 'attributes': 'rw'},
+    'SRAM2': {'address': 0x20020000, 'limit_size': 32 * 1024},
+}
+
+# Top-level report keys and per-symbol keys the generator must emit
+_REPORT_FIELDS = frozenset({
+    'file_path', 'architecture', 'entry_point', 'file_type',
+    'machine', 'symbols', 'program_headers', 'memory_layout'
+})
+_SYMBOL_FIELDS = frozenset({
+    'name', 'address', 'size', 'type', 'binding', 'section'
+})
+
+_ELF_MAGIC = b'\x7fELF'
+
+# Symbols defined by simple_program.c
+_EXPECTED_SYMBOLS = frozenset({'main', 'global_counter'})
+
+
+@functools.lru_cache(maxsize=1)
+def _find_gcc():
+    """Return the first working GCC command, probing at most once per process"""
+    for gcc_cmd in ('gcc', 'arm-none-eabi-gcc'):
+        try:
+            subprocess.run([gcc_cmd, '--version'],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           check=True, timeout=PROBE_TIMEOUT)
+            return gcc_cmd
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired,
+                FileNotFoundError):
+            continue
+    return None
+
+
+def _compile_command(gcc_command, output):
+    """Build the GCC command line for the test program"""
+    return [
+        gcc_command,
+        '-nostdlib',           # Don't link standard libraries
+        '-nostartfiles',       # Don't use standard startup files
+        '-g',                  # Generate debug information
+        '-I', str(_TEST_DIR),  # Include directory for uart_driver.h
+        '-T', str(_LD_FILE),   # Use our custom linker script
+        '-o', str(output),     # Output file
+        str(_C_FILE)           # Input file
+    ]
+
+
+def _cache_key(gcc_command):
+    """Return the (location, inputs) digests naming a cached build"""
+    # The working directory (recorded in DW_AT_comp_dir) and the absolute
+    # paths in the command line tie a build to where it was made
+    location = hashlib.sha256()
+    location.update(os.getcwd().encode())
+    location.update(' '.join(_compile_command(gcc_command, '-')).encode())
+
+    # A source edit or a compiler upgrade must not reuse an old build
+    inputs = hashlib.sha256()
+    for path in (_C_FILE, _LD_FILE, _TEST_DIR / 'uart_driver.h'):
+        inputs.update(path.read_bytes())
+    compiler = shutil.which(gcc_command)
+    inputs.update(f'{compiler}:{os.stat(compiler).st_mtime_ns}'.encode())
+    return location.hexdigest()[:12], inputs.hexdigest()[:12]
+
+
+def _cached_elf(gcc_command):
+    """Return a cached build of the test program, compiling it if missing"""
+    location, inputs = _cache_key(gcc_command)
+    cached = _ELF_CACHE_DIR / f'simple_program-{location}-{inputs}.elf'
+    if cached.exists():
+        return cached
+
+    _ELF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Compile beside the cache entry and rename, so a concurrent
+    # run never sees a partially written ELF
+    partial = cached.with_name(f'{cached.name}.{os.getpid()}.tmp')
+    try:
+        run_compilation(_compile_command(gcc_command, partial),
+                        "Compilation successful", timeout=COMPILE_TIMEOUT)
+        os.replace(partial, cached)
+    finally:
+        try:
+            partial.unlink()
+        except FileNotFoundError:
+            pass
+
+    # Only builds made from this same location are superseded; other
+    # checkouts and working directories keep their own entries
+    for stale in _ELF_CACHE_DIR.glob(f'simple_program-{location}-*.elf'):
+        if stale != cached:
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+    return cached
+
+
+def _build_elf(gcc_command, elf_file):
+    """Compile the test program to elf_file, reusing an identical cached build"""
+    try:
+        cached = _cached_elf(gcc_command)
+    except OSError as e:
+        # An unusable cache costs the reuse, not the build
+        print(f"ELF cache unavailable ({e}); compiling directly")
+        run_compilation(_compile_command(gcc_command, elf_file),
+                        "Compilation successful", timeout=COMPILE_TIMEOUT)
+        return
+    shutil.copyfile(cached, elf_file)
+
+
+@contextlib.contextmanager
+def compiled_test_program():
+    """
+    Build simple_program in a private temp dir for scripts outside this suite.
+
+    Yields:
+        Path to the ELF file; the temp dir is removed on exit
+
+    Raises:
+        unittest.SkipTest: If no compiler can link the embedded linker script
+    """
+    gcc_command = _find_gcc()
+    if gcc_command is None:
+        raise unittest.SkipTest("No suitable GCC compiler found")
+    if not can_compile_embedded(gcc_command):
+        raise unittest.SkipTest(
+            "Native compiler on Windows cannot link embedded linker scripts")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        elf_file = temp_dir / 'simple_program.elf'
+        _build_elf(gcc_command, elf_file)
+        yield elf_file
+    finally:
+        rmtree_robust(temp_dir)
+
+
+def _run_bloaty(args, elf_file, output_path):
+    """Run bloaty --csv on elf_file, writing its output straight to output_path"""
+    with open(output_path, 'wb') as f:
+        subprocess.run(['bloaty', '--csv', *args, str(elf_file)],
+                       stdout=f, stderr=subprocess.PIPE, check=True,
+                       timeout=BLOATY_TIMEOUT)
 
 
 # pylint: disable=too-many-instance-attributes
 class TestMemoryAnalysis(unittest.TestCase):
     """Test cases for memory analysis functionality"""
 
-    def setUp(self):
-        """Set up test environment"""
-        self.test_dir = Path(__file__).parent
-        self.temp_dir = Path(tempfile.mkdtemp())
+    # Set by setUpClass; stays None until the suite has run in this process
+    report = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Probe the toolchain and compile the test program once per suite"""
+        cls.test_dir = _TEST_DIR
+        cls.temp_dir = Path(tempfile.mkdtemp())
 
         # Paths to test files
-        self.c_file = self.test_dir / 'simple_program.c'
-        self.ld_file = self.test_dir / 'simple_program.ld'
-        self.elf_file = self.temp_dir / 'simple_program.elf'
+        cls.c_file = _C_FILE
+        cls.ld_file = _LD_FILE
+        cls.elf_file = cls.temp_dir / 'simple_program.elf'
+
+        # Find GCC compiler
+        cls.gcc_command = _find_gcc() if HAS_GCC else None
+
+        cls.compile_error = None
+        if cls.gcc_command and can_compile_embedded(cls.gcc_command):
+            try:
+                _build_elf(cls.gcc_command, cls.elf_file)
+            except subprocess.CalledProcessError as e:
+                cls.compile_error = e.stderr
+            except subprocess.TimeoutExpired as e:
+                cls.compile_error = f"{e.cmd[0]} timed out after {e.timeout}s"
+            except OSError as e:
+                cls.compile_error = str(e)
+
+        # Parse the linker script and build the report once; the
+        # verification tests below all assert against these results
+        cls.memory_regions_data = parse_linker_scripts([str(cls.ld_file)])
+        cls.report = None
+        cls.report_error = None
+        if cls.elf_file.exists():
+            try:
+                cls.report = ReportGenerator(
+                    str(cls.elf_file), cls.memory_regions_data).generate_report()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                cls.report_error = e
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up test environment"""
+        if cls.temp_dir.exists():
+            rmtree_robust(cls.temp_dir)
+
+    def setUp(self):
+        """Set up test environment"""
+        # Per-test artifacts live under the suite temp dir, which is
+        # removed once in tearDownClass rather than after every test
+        self.output_dir = self.temp_dir / self._testMethodName
+        self.output_dir.mkdir(exist_ok=True)
 
         # Bloaty output files (initialized here to fix pylint warnings)
         self.bloaty_sections = None
         self.bloaty_symbols = None
         self.bloaty_segments = None
 
-        # Find GCC compiler
-        self.gcc_command = None
-        for gcc_cmd in ['gcc', 'arm-none-eabi-gcc']:
-            try:
-                subprocess.run([gcc_cmd, '--version'],
-                               capture_output=True, check=True)
-                self.gcc_command = gcc_cmd
-                break
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-
         # Ensure test files exist
         self.assertTrue(self.c_file.exists(),
                         f"Test C file not found: {self.c_file}")
         self.assertTrue(self.ld_file.exists(),
                         f"Test linker script not found: {self.ld_file}")
 
-    def tearDown(self):
-        """Clean up test environment"""
-        if self.temp_dir.exists():
-            rmtree_robust(self.temp_dir)
+    def _require_elf(self):
+        """Skip or fail the current test unless the suite ELF was built"""
+        if not can_compile_embedded(self.gcc_command):
+            self.skipTest("Native compiler on Windows cannot link embedded linker scripts")
+        if self.compile_error is not None:
+            self.fail(f"Compilation failed: {self.compile_error}")
+        self.assertTrue(self.elf_file.exists(), "ELF file was not created")
+
+    def _require_report(self):
+        """Return the suite report, failing the test if generation raised"""
+        self._require_elf()
+        if self.report_error is not None:
+            self.fail(f"Failed to generate memory report: {self.report_error}")
+        return self.report
 
     def test_01_check_prerequisites(self):
         """Test that required tools are available"""
-        # Check for GCC (or arm-none-eabi-gcc)
-        gcc_available = False
-        for gcc_cmd in ['gcc', 'arm-none-eabi-gcc']:
-            try:
-                subprocess.run([gcc_cmd, '--version'],
-                               capture_output=True, check=True)
-                gcc_available = True
-                self.gcc_command = gcc_cmd
-                print(f"Found GCC: {gcc_cmd}")
-                break
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-
-        self.assertTrue(gcc_available, "No suitable GCC compiler found")
-
-        # Check for Bloaty
-        try:
-            subprocess.run(['bloaty', '--version'],
-                           capture_output=True, check=True)
+        self.assertIsNotNone(self.gcc_command, "No suitable GCC compiler found")
+        print(f"Found GCC: {self.gcc_command}")
+
+        if HAS_BLOATY:
             print("Found Bloaty")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             print("Bloaty not found - install it manually or via GitHub Actions")
 
+    @unittest.skipUnless(HAS_GCC, 'gcc unavailable')
     def test_02_compile_test_program(self):
         """Test compilation of the test program"""
-        if not can_compile_embedded(self.gcc_command):
-            self.skipTest("Native compiler on Windows cannot link embedded linker scripts")
-
-        # Compile the test program
-        compile_cmd = [
-            self.gcc_command,
-            '-nostdlib',           # Don't link standard libraries
-            '-nostartfiles',       # Don't use standard startup files
-            '-g',                  # Generate debug information
-            '-I', str(self.test_dir),  # Include directory for uart_driver.h
-            '-T', str(self.ld_file),  # Use our custom linker script
-            '-o', str(self.elf_file),  # Output file
-            str(self.c_file)       # Input file
-        ]
-
-        try:
-            run_compilation(compile_cmd, "Compilation successful")
-        except subprocess.CalledProcessError as e:
-            self.fail(f"Compilation failed: {e.stderr}")
-
-        # Verify ELF file was created
-        self.assertTrue(self.elf_file.exists(), "ELF file was not created")
+        self._require_elf()
 
         # Verify it's actually an ELF file
-        with open(self.elf_file, 'rb') as f:
-            magic = f.read(4)
-            self.assertEqual(
-                magic,
-                b'\x7fELF',
-                "Output file is not a valid ELF file")
+        fd = os.open(self.elf_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            magic = os.read(fd, len(_ELF_MAGIC))
+        finally:
+            os.close(fd)
+        self.assertEqual(magic, _ELF_MAGIC, "Output file is not a valid ELF file")
 
     def test_03_parse_linker_script(self):
         """Test parsing of the linker script"""
-        memory_regions = parse_linker_scripts([str(self.ld_file)])
+        memory_regions = self.memory_regions_data
 
-        # Verify we found the expected memory regions
-        self.assertIn('FLASH', memory_regions, "FLASH region not found")
-        self.assertIn('RAM', memory_regions, "RAM region not found")
-        self.assertIn('SRAM2', memory_regions, "SRAM2 region not found")
-
-        # Verify FLASH region properties
-        flash_region = memory_regions['FLASH']
-        self.assertEqual(flash_region['address'], 0x08000000)
-        self.assertEqual(flash_region['limit_size'], 512 * 1024)  # 512K
-        self.assertEqual(flash_region['attributes'], 'rx')
-
-        # Verify RAM region properties
-        ram_region = memory_regions['RAM']
-        self.assertEqual(ram_region['address'], 0x20000000)
-        self.assertEqual(ram_region['limit_size'], 128 * 1024)  # 128K
-        self.assertEqual(ram_region['attributes'], 'rw')
-
-        # Verify SRAM2 region properties
-        sram2_region = memory_regions['SRAM2']
-        self.assertEqual(sram2_region['address'], 0x20020000)
-        self.assertEqual(sram2_region['limit_size'], 32 * 1024)  # 32K
+        # Verify we found the expected memory regions and their properties
+        for name, expected in _EXPECTED_REGIONS.items():
+            self.assertIn(name, memory_regions, f"{name} region not found")
+            region = memory_regions[name]
+            self.assertEqual({key: region.get(key) for key in expected},
+                             expected, f"{name} region properties differ")
 
         # Validate the memory layout
         self.assertTrue(validate_memory_regions(memory_regions))
 
         print("Linker script parsing: PASSED")
 
+    @unittest.skipUnless(HAS_GCC, 'gcc unavailable')
+    @unittest.skipUnless(HAS_BLOATY, 'bloaty unavailable')
     def test_04_generate_bloaty_data(self):
         """Test generation of Bloaty analysis data"""
-        if not can_compile_embedded(self.gcc_command):
-            self.skipTest("Native compiler on Windows cannot link embedded linker scripts")
-
-        # Ensure we have the ELF file from previous test
-        if not self.elf_file.exists():
-            self.test_02_compile_test_program()
+        self._require_elf()
 
         # Create temporary files for Bloaty output
-        self.bloaty_sections = self.temp_dir / 'bloaty_sections.csv'
-        self.bloaty_symbols = self.temp_dir / 'bloaty_symbols.csv'
-        self.bloaty_segments = self.temp_dir / 'bloaty_segments.csv'
-
-        # Check if bloaty is available
+        self.bloaty_sections = self.output_dir / 'bloaty_sections.csv'
+        self.bloaty_symbols = self.output_dir / 'bloaty_symbols.csv'
+        self.bloaty_segments = self.output_dir / 'bloaty_segments.csv'
+
+        # The three reports are independent, so run them concurrently
+        jobs = [
+            ([], self.bloaty_sections),                      # sections
+            (['-d', 'symbols'], self.bloaty_symbols),        # symbols
+            (['-d', 'segments'], self.bloaty_segments),      # segments
+        ]
         try:
-            # Generate sections analysis
-            result = subprocess.run([
-                'bloaty', '--csv', str(self.elf_file)
-            ], capture_output=True, text=True, check=True)
-
-            with open(self.bloaty_sections, 'w', encoding='utf-8') as f:
-                f.write(result.stdout)
-
-            # Generate symbols analysis
-            result = subprocess.run([
-                'bloaty', '--csv', '-d', 'symbols', str(self.elf_file)
-            ], capture_output=True, text=True, check=True)
-
-            with open(self.bloaty_symbols, 'w', encoding='utf-8') as f:
-                f.write(result.stdout)
-
-            # Generate segments analysis
-            result = subprocess.run([
-                'bloaty', '--csv', '-d', 'segments', str(self.elf_file)
-            ], capture_output=True, text=True, check=True)
-
-            with open(self.bloaty_segments, 'w', encoding='utf-8') as f:
-                f.write(result.stdout)
-
-            print("Bloaty analysis: PASSED")
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                list(executor.map(
+                    lambda job: _run_bloaty(job[0], self.elf_file, job[1]),
+                    jobs))
+        except subprocess.CalledProcessError as e:
+            self.fail(f"Bloaty failed: {e.stderr}")
+        except subprocess.TimeoutExpired as e:
+            self.fail(f"Bloaty timed out after {e.timeout}s")
 
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            # If Bloaty is not available, create mock CSV data for testing
-            print(
-                f"Bloaty not available ({e}), creating mock data for testing")
-            print("Note: In GitHub Actions, Bloaty will be installed automatically")
-            self._create_mock_bloaty_data()
-
-    def _create_mock_bloaty_data(self):
-        """Create mock Bloaty CSV data for testing when Bloaty is not available"""
-        # Mock sections data
-        sections_csv = '''sections,filesize,vmsize
-.text,2048,2048
-.rodata,512,512
-.data,256,256
-.bss,0,1024
-'''
-        with open(self.bloaty_sections, 'w', encoding='utf-8') as f:
-            f.write(sections_csv)
-
-        # Mock symbols data
-        symbols_csv = '''symbols,filesize,vmsize
-main,512,512
-initialize_system,256,256
-calculate_checksum,384,384
-delay_ms,128,128
-global_counter,4,4
-lookup_table,64,64
-buffer,0,256
-'''
-        with open(self.bloaty_symbols, 'w', encoding='utf-8') as f:
-            f.write(symbols_csv)
-
-        # Mock segments data
-        segments_csv = '''segments,filesize,vmsize
-LOAD,2816,2816
-LOAD,256,1280
-'''
-        with open(self.bloaty_segments, 'w', encoding='utf-8') as f:
-            f.write(segments_csv)
+        print("Bloaty analysis: PASSED")
 
+    @unittest.skipUnless(HAS_GCC, 'gcc unavailable')
     def test_05_generate_memory_report(self):
         """Test generation of the memory report"""
-        if not can_compile_embedded(self.gcc_command):
-            self.skipTest("Native compiler on Windows cannot link embedded linker scripts")
-
-        # Ensure we have all prerequisites
-        if not self.elf_file.exists():
-            self.test_02_compile_test_program()
-
-        # No longer need bloaty data
-
-        # Parse memory regions first
-        try:
-            # pylint: disable=import-outside-toplevel,reimported
-            from membrowse.linker.parser import parse_linker_scripts as parse_scripts
-            memory_regions_data = parse_scripts([str(self.ld_file)])
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.fail(f"Failed to parse memory regions: {e}")
-
-        # Generate memory report
-        generator = ReportGenerator(
-            str(self.elf_file), memory_regions_data)
-
-        try:
-            report = generator.generate_report()
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.fail(f"Failed to generate memory report: {e}")
+        report = self._require_report()
 
         # Save report for inspection
-        report_file = self.temp_dir / 'memory_report.json'
+        # Compact by default; set DEBUG_REPORT=1 for a human-readable dump
+        report_file = self.output_dir / 'memory_report.json'
         with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+            if os.environ.get('DEBUG_REPORT'):
+                json.dump(report, f, indent=2)
+            else:
+                json.dump(report, f, separators=(',', ':'))
 
         print(f"Memory report saved to: {report_file}")
 
@@ -323,42 +413,28 @@ LOAD,256,1280
                 "Warning: jsonschema library not installed - skipping schema validation")
 
         # Manual structure verification as backup
-        required_fields = [
-            'file_path', 'architecture', 'entry_point', 'file_type',
-            'machine', 'symbols', 'program_headers', 'memory_layout'
-        ]
-
-        for field in required_fields:
-            self.assertIn(
-                field,
-                report,
-                f"Required field '{field}' missing from report")
+        if not report.keys() >= _REPORT_FIELDS:
+            self.fail("Required fields missing from report: "
+                      f"{sorted(_REPORT_FIELDS - report.keys())}")
 
         # Verify symbols structure
         symbols = report['symbols']
         self.assertIsInstance(symbols, list, "Symbols should be a list")
         if symbols:
             symbol = symbols[0]
-            symbol_fields = [
-                'name',
-                'address',
-                'size',
-                'type',
-                'binding',
-                'section',
-                'source_file']
-            for field in symbol_fields:
-                self.assertIn(
-                    field, symbol, f"Required symbol field '{field}' missing")
+            symbol_fields = _SYMBOL_FIELDS | {'source_file'}
+            if not symbol.keys() >= symbol_fields:
+                self.fail("Required symbol fields missing: "
+                          f"{sorted(symbol_fields - symbol.keys())}")
 
     def _verify_memory_regions(self, report):
         """Verify memory regions in the report"""
         memory_layout = report['memory_layout']
 
         # Should have our three regions
-        self.assertIn('FLASH', memory_layout)
-        self.assertIn('RAM', memory_layout)
-        self.assertIn('SRAM2', memory_layout)
+        if not memory_layout.keys() >= _EXPECTED_REGIONS.keys():
+            self.fail("Regions missing from layout: "
+                      f"{sorted(_EXPECTED_REGIONS.keys() - memory_layout.keys())}")
 
         # Verify FLASH region
         flash_region = memory_layout['FLASH']
@@ -372,7 +448,7 @@ LOAD,256,1280
         # Should have some sections mapped to FLASH (code and rodata)
         flash_sections = flash_region['sections']
         section_names = [s['name'] for s in flash_sections]
-        self.assertTrue(any('.text' in name for name in section_names),
+        self.assertTrue(any(name.startswith('.text') for name in section_names),
                         "No .text section found in FLASH region")
 
     def _verify_sections(self, report):
@@ -383,49 +459,23 @@ LOAD,256,1280
 
         # Verify symbol structure
         for symbol in symbols[:3]:  # Check first few symbols
-            required_fields = [
-                'name',
-                'address',
-                'size',
-                'type',
-                'binding',
-                'section']
-            for field in required_fields:
-                self.assertIn(field, symbol, f"Symbol missing field '{field}'")
+            if not symbol.keys() >= _SYMBOL_FIELDS:
+                self.fail("Symbol missing fields: "
+                          f"{sorted(_SYMBOL_FIELDS - symbol.keys())}")
 
         # Check for expected symbols from our test program
         symbol_names = [s['name'] for s in symbols]
-        expected_symbols = ['main', 'global_counter']
-        for expected in expected_symbols:
-            if not any(expected in name for name in symbol_names):
-                print(
-                    f"Warning: Expected symbol '{expected}' not found in: {symbol_names[:10]}")
+        for expected in _EXPECTED_SYMBOLS - frozenset(symbol_names):
+            print(
+                f"Warning: Expected symbol '{expected}' not found in: {symbol_names[:10]}")
 
+    @unittest.skipUnless(HAS_GCC, 'gcc unavailable')
     def test_06_schema_validation(self):
         """Test that generated report matches the expected JSON schema"""
         if not JSONSCHEMA_AVAILABLE:
             self.skipTest("jsonschema library not available")
 
-        # Ensure we have the ELF file from previous test
-        if not self.elf_file.exists():
-            self.test_02_compile_test_program()
-
-        # Parse memory regions
-        try:
-            # pylint: disable=import-outside-toplevel,reimported
-            from membrowse.linker.parser import parse_linker_scripts as parse_scripts
-            memory_regions_data = parse_scripts([str(self.ld_file)])
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.fail(f"Failed to parse memory regions: {e}")
-
-        # Generate memory report
-        generator = ReportGenerator(
-            str(self.elf_file), memory_regions_data)
-
-        try:
-            report = generator.generate_report()
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.fail(f"Failed to generate memory report: {e}")
+        report = self._require_report()
 
         # Load and validate schema
         schema = self._load_schema()
@@ -443,110 +493,52 @@ LOAD,256,1280
             self.fail(f"Schema itself is invalid: {e.message}")
 
 
-# pylint: disable=too-many-locals,too-many-statements
 def run_full_integration_test():
     """Run a full integration test using collect_report.sh"""
     print("\n" + "=" * 60)
     print("RUNNING INTEGRATION TEST")
     print("=" * 60)
 
-    test_dir = Path(__file__).parent
-    shared_dir = test_dir.parent / 'shared'
-    temp_dir = Path(tempfile.mkdtemp())
+    shared_dir = _TEST_DIR.parent / 'shared'
 
     try:
-        # Compile the test program
-        c_file = test_dir / 'simple_program.c'
-        ld_file = test_dir / 'simple_program.ld'
-        elf_file = temp_dir / 'simple_program.elf'
+        with compiled_test_program() as elf_file:
+            print(f"✓ Compiled test program: {elf_file}")
 
-        # Find a suitable compiler
-        gcc_command = None
-        for gcc_cmd in ['gcc', 'arm-none-eabi-gcc']:
-            try:
-                subprocess.run([gcc_cmd, '--version'],
-                               capture_output=True, check=True)
-                gcc_command = gcc_cmd
-                break
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-
-        if not gcc_command:
-            print("ERROR: No suitable GCC compiler found")
-            return False
-
-        # Compile
-        compile_cmd = [
-            gcc_command, '-nostdlib', '-nostartfiles',
-            '-T', str(ld_file), '-o', str(elf_file), str(c_file)
-        ]
+            # Check if Bloaty is available for full integration test
+            if not HAS_BLOATY:
+                print("⚠️  Bloaty not available - running limited integration test")
 
-        subprocess.run(compile_cmd, capture_output=True, check=True)
-        print(f"✓ Compiled test program: {elf_file}")
+                # Reuse the suite's report when it ran in this process: both
+                # ELFs are builds of simple_program with the same command line
+                report = TestMemoryAnalysis.report
+                if report is None:
+                    report = ReportGenerator(
+                        str(elf_file),
+                        parse_linker_scripts([str(_LD_FILE)])).generate_report()
 
-        # Check if Bloaty is available for full integration test
-        try:
-            subprocess.run(['bloaty', '--version'],
-                           capture_output=True, check=True)
-            bloaty_available = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            bloaty_available = False
-
-        if not bloaty_available:
-            print("⚠️  Bloaty not available - running limited integration test")
-
-            # Test just the memory_report.py directly with mock data
-            sys.path.insert(0, str(shared_dir))
-
-            # Create mock bloaty files
-            mock_dir = temp_dir / 'mock'
-            mock_dir.mkdir()
-
-            sections_csv = '''sections,filesize,vmsize
-.text,2048,2048
-.rodata,512,512
-.data,256,256
-.bss,0,1024
-'''
-            (mock_dir / 'sections.csv').write_text(sections_csv)
-
-            symbols_csv = '''symbols,filesize,vmsize
-main,512,512
-global_counter,4,4
-'''
-            (mock_dir / 'symbols.csv').write_text(symbols_csv)
-
-            segments_csv = '''segments,filesize,vmsize
-LOAD,2816,2816
-'''
-            (mock_dir / 'segments.csv').write_text(segments_csv)
-
-            # Generate report
-            generator = ReportGenerator(str(elf_file), {})
-            report = generator.generate_report()
-
-            # Verify basic report structure
-            assert 'memory_layout' in report
-            assert 'FLASH' in report['memory_layout']
-            assert 'RAM' in report['memory_layout']
-
-            print("✓ Limited integration test PASSED")
-            return True
+                # Verify basic report structure
+                assert 'memory_layout' in report
+                assert 'FLASH' in report['memory_layout']
+                assert 'RAM' in report['memory_layout']
+
+                print("✓ Limited integration test PASSED")
+                return True
+
+            # Run full collect_report.sh
+            collect_script = shared_dir / 'collect_report.sh'
 
-        # Run full collect_report.sh
-        collect_script = shared_dir / 'collect_report.sh'
-
-        result = subprocess.run([
-            'bash', str(collect_script),
-            str(elf_file),                    # ELF path
-            str(ld_file),                     # LD scripts
-            'test-target',                    # Target name
-            '',                               # API key (empty)
-            'abc123',                         # Commit SHA
-            'def456',                         # Base SHA
-            'test-branch',                    # Branch name
-            'test/repo'                       # Repo name
-        ], capture_output=True, text=True, timeout=120, check=False)
+            result = subprocess.run([
+                'bash', str(collect_script),
+                str(elf_file),                    # ELF path
+                str(_LD_FILE),                    # LD scripts
+                'test-target',                    # Target name
+                '',                               # API key (empty)
+                'abc123',                         # Commit SHA
+                'def456',                         # Base SHA
+                'test-branch',                    # Branch name
+                'test/repo'                       # Repo name
+            ], capture_output=True, text=True, timeout=120, check=False)
 
         if result.returncode == 0:
             print("✓ Full integration test PASSED")
@@ -561,12 +553,12 @@ LOAD,2816,2816
               > 1000 else result.stderr)
         return False
 
+    except unittest.SkipTest as e:
+        print(f"ERROR: {e}")
+        return False
     except Exception as e:  # pylint: disable=broad-exception-caught
         print(f"✗ Integration test FAILED: {e}")
         return False
-    finally:
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
 
 
 if __name__ == '__main__':
@@ -13,7 +13,6 @@ This test suite covers:
 """
 # pylint: disable=duplicate-code
 
-import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -21,9 +20,6 @@ from pathlib import Path
 from membrowse.linker.parser import parse_linker_scripts, LinkerScriptParser
 from tests.test_utils import validate_memory_regions
 
-# Add shared directory to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
-
 
 class TestMemoryRegions(unittest.TestCase):
     """Test cases for memory regions parsing functionality"""
@@ -483,6 +479,30 @@ class TestMemoryRegions(unittest.TestCase):
         # Test with whitespace
         self.assertEqual(builder._parse_size('  512K  '), 512 * 1024)
 
+    def test_plain_literals_skip_full_evaluation(self):
+        """Plain literals are returned without the function/variable passes"""
+        # pylint: disable=import-outside-toplevel
+        from unittest.mock import patch
+        from membrowse.linker.parser import ExpressionEvaluator
+
+        evaluator = ExpressionEvaluator()
+        cases = {
+            '0x08000000': 0x08000000,
+            '0X1F': 0x1f,
+            '4096': 4096,
+            '0': 0,
+            '512K': 512 * 1024,
+            '2mb': 2 * 1024 * 1024,
+        }
+        with patch.object(evaluator, '_handle_linker_functions') as functions:
+            for expr, expected in cases.items():
+                self.assertEqual(
+                    evaluator.evaluate_expression(expr), expected, expr)
+            functions.assert_not_called()
+
+        # Leading-zero decimals still go through the octal handling
+        self.assertEqual(evaluator.evaluate_expression('010'), 0o10)
+
 
 class TestAdvancedLinkerFeatures(unittest.TestCase):
     """Test cases for advanced linker script features that are NOT currently supported"""
@@ -1015,6 +1035,20 @@ class TestIncludeDirective(unittest.TestCase):
         regions = parse_linker_scripts([str(outer)])
         self.assertIn('FLASH', regions)
 
+    def test_include_of_non_utf8_file_is_not_fatal(self):
+        """Undecodable bytes in an INCLUDE'd file are replaced, not raised."""
+        path_bin = self.temp_dir / 'blob.ld'
+        with open(path_bin, 'wb') as f:
+            f.write(b'\xff\xfe\x00/* \x80 */')
+        self.test_files.append(path_bin)
+        outer = self.create_test_file('''
+            INCLUDE "blob.ld"
+            MEMORY { FLASH (rx) : ORIGIN = 0x0, LENGTH = 1K }
+        ''', 'outer.ld')
+
+        regions = parse_linker_scripts([str(outer)])
+        self.assertEqual(list(regions), ['FLASH'])
+
 
 if __name__ == '__main__':
     print("Memory Regions Test Suite")
@@ -15,53 +15,22 @@ Test categories:
 """
 # pylint: disable=duplicate-code
 
-import sys
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from membrowse.linker.parser import (
     LinkerScriptParser,
     parse_linker_scripts,
+    parse_linker_scripts_from_string,
     LinkerScriptError,
     ExpressionEvaluationError,
     RegionParsingError
 )
 
-# Add shared directory to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
 
-
-class TestMalformedLinkerScripts(unittest.TestCase):
-    """Test cases for malformed linker script handling"""
-
-    def setUp(self):
-        """Set up test environment"""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.test_files = []
-
-    def tearDown(self):
-        """Clean up test files"""
-        for file_path in self.test_files:
-            if file_path.exists():
-                file_path.unlink()
-        if self.temp_dir.exists():
-            self.temp_dir.rmdir()
-
-    def create_test_file(self, content: str, filename: str = None) -> Path:
-        """Create a temporary test file with given content"""
-        if filename is None:
-            filename = f"test_{len(self.test_files)}.ld"
-
-        file_path = self.temp_dir / filename
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        self.test_files.append(file_path)
-        return file_path
-
-
-class TestSyntaxErrors(TestMalformedLinkerScripts):
+class TestSyntaxErrors(unittest.TestCase):
     """Test malformed syntax handling"""
 
     def test_unclosed_memory_block(self):
@@ -74,11 +43,9 @@ class TestSyntaxErrors(TestMalformedLinkerScripts):
         /* Missing closing brace */
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should not crash, should return empty result or handle gracefully
         try:
-            regions = parse_linker_scripts([str(file_path)])
+            regions = parse_linker_scripts_from_string(content)
             # Either empty regions or some regions parsed before the error
             self.assertIsInstance(regions, dict)
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -96,8 +63,7 @@ class TestSyntaxErrors(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should not find valid MEMORY block
         self.assertEqual(len(regions), 0)
@@ -124,11 +90,9 @@ class TestSyntaxErrors(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should raise RegionParsingError for malformed syntax
         with self.assertRaises(RegionParsingError):
-            parse_linker_scripts([str(file_path)])
+            parse_linker_scripts_from_string(content)
 
     def test_invalid_parentheses_nesting(self):
         """Test invalid parentheses and nesting"""
@@ -146,8 +110,7 @@ class TestSyntaxErrors(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should handle gracefully
         self.assertIsInstance(regions, dict)
@@ -164,14 +127,13 @@ class TestSyntaxErrors(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should return empty dict for completely invalid content
         self.assertEqual(len(regions), 0)
 
 
-class TestInvalidAddressFormats(TestMalformedLinkerScripts):
+class TestInvalidAddressFormats(unittest.TestCase):
     """Test invalid address and size format handling"""
 
     def test_invalid_hex_addresses(self):
@@ -193,11 +155,9 @@ class TestInvalidAddressFormats(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should raise RegionParsingError for invalid hex addresses
         with self.assertRaises(RegionParsingError):
-            parse_linker_scripts([str(file_path)])
+            parse_linker_scripts_from_string(content)
 
     def test_invalid_size_formats(self):
         """Test invalid size formats"""
@@ -221,11 +181,9 @@ class TestInvalidAddressFormats(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should raise RegionParsingError for invalid size formats
         with self.assertRaises(RegionParsingError):
-            parse_linker_scripts([str(file_path)])
+            parse_linker_scripts_from_string(content)
 
     def test_extreme_address_values(self):
         """Test extreme address values that might cause overflow"""
@@ -243,11 +201,9 @@ class TestInvalidAddressFormats(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should handle gracefully without crashing
         try:
-            regions = parse_linker_scripts([str(file_path)])
+            regions = parse_linker_scripts_from_string(content)
             self.assertIsInstance(regions, dict)
         except (OverflowError, ValueError):
             # These specific exceptions are acceptable for extreme values
@@ -275,14 +231,12 @@ class TestInvalidAddressFormats(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should raise RegionParsingError for invalid expressions
         with self.assertRaises(RegionParsingError):
-            parse_linker_scripts([str(file_path)])
+            parse_linker_scripts_from_string(content)
 
 
-class TestCorruptedMemoryBlocks(TestMalformedLinkerScripts):
+class TestCorruptedMemoryBlocks(unittest.TestCase):
     """Test corrupted MEMORY block structures"""
 
     def test_multiple_memory_blocks_conflicting(self):
@@ -300,8 +254,7 @@ class TestCorruptedMemoryBlocks(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should handle multiple MEMORY blocks (typically last one wins)
         self.assertIsInstance(regions, dict)
@@ -324,11 +277,9 @@ class TestCorruptedMemoryBlocks(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should raise RegionParsingError for nested MEMORY blocks
         with self.assertRaises(RegionParsingError):
-            parse_linker_scripts([str(file_path)])
+            parse_linker_scripts_from_string(content)
 
     def test_memory_block_with_invalid_content(self):
         """Test MEMORY block containing non-memory definitions"""
@@ -350,11 +301,9 @@ class TestCorruptedMemoryBlocks(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should raise RegionParsingError for invalid content in MEMORY block
         with self.assertRaises(RegionParsingError):
-            parse_linker_scripts([str(file_path)])
+            parse_linker_scripts_from_string(content)
 
     def test_empty_memory_block(self):
         """Test completely empty MEMORY block"""
@@ -364,16 +313,34 @@ class TestCorruptedMemoryBlocks(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should return empty dict
         self.assertEqual(len(regions), 0)
 
 
-class TestFileSystemErrors(TestMalformedLinkerScripts):
+class TestFileSystemErrors(unittest.TestCase):
     """Test file system related errors"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Write the empty and binary script fixtures once for the class"""
+        # Lives across the class's tests; cleaned up in tearDownClass
+        cls._tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        temp_dir = Path(cls._tmp.name)
+
+        cls.empty_fixture = temp_dir / "empty.ld"
+        cls.empty_fixture.write_bytes(b'')
+
+        cls.binary_fixture = temp_dir / "binary.ld"
+        cls.binary_fixture.write_bytes(
+            b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory and everything in it"""
+        cls._tmp.cleanup()
+
     def test_nonexistent_file(self):
         """Test parsing non-existent linker script"""
         nonexistent_path = "/path/that/does/not/exist/script.ld"
@@ -383,32 +350,16 @@ class TestFileSystemErrors(TestMalformedLinkerScripts):
 
     def test_empty_file(self):
         """Test parsing completely empty linker script"""
-        content = ""
-
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts([str(self.empty_fixture)])
 
         # Should return empty dict
         self.assertEqual(len(regions), 0)
 
     def test_binary_file(self):
         """Test parsing binary file as linker script"""
-        # Create a file with binary content
-        file_path = self.temp_dir / "binary.ld"
-        with open(file_path, 'wb') as f:
-            f.write(
-                b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f')
-
-        self.test_files.append(file_path)
-
-        # Should handle gracefully
-        try:
-            regions = parse_linker_scripts([str(file_path)])
-            self.assertIsInstance(regions, dict)
-            self.assertEqual(len(regions), 0)  # No valid memory regions
-        except UnicodeDecodeError:
-            # This is also acceptable behavior
-            pass
+        # Undecodable bytes are replaced on read, so no UnicodeDecodeError
+        regions = parse_linker_scripts([str(self.binary_fixture)])
+        self.assertEqual(regions, {})  # No valid memory regions
 
     def test_permission_denied_simulation(self):
         """Test handling of files that might have permission issues"""
@@ -423,14 +374,13 @@ class TestFileSystemErrors(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should handle gracefully
         self.assertIsInstance(regions, dict)
 
 
-class TestEdgeCasesAndBoundaryConditions(TestMalformedLinkerScripts):
+class TestEdgeCasesAndBoundaryConditions(unittest.TestCase):
     """Test edge cases and boundary conditions"""
 
     def test_zero_sized_regions(self):
@@ -444,11 +394,10 @@ class TestEdgeCasesAndBoundaryConditions(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should handle zero-sized regions
-        self.assertIsInstance(regions, dict)
+        self.assertEqual(set(regions), {'FLASH', 'RAM', 'SRAM'})
         for region in regions.values():
             self.assertEqual(region['limit_size'], 0)
 
@@ -464,11 +413,9 @@ class TestEdgeCasesAndBoundaryConditions(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should parse all regions (validation is separate from parsing)
-        self.assertIsInstance(regions, dict)
         self.assertEqual(len(regions), 4)
 
     def test_regions_with_same_name(self):
@@ -482,11 +429,9 @@ class TestEdgeCasesAndBoundaryConditions(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        regions = parse_linker_scripts_from_string(content)
 
         # Should handle duplicate names (typically last one wins)
-        self.assertIsInstance(regions, dict)
         self.assertIn('FLASH', regions)
         self.assertIn('RAM', regions)
         # Check which FLASH definition was used
@@ -494,26 +439,21 @@ class TestEdgeCasesAndBoundaryConditions(TestMalformedLinkerScripts):
 
     def test_very_long_content(self):
         """Test very long linker script content"""
-        # Create a script with many regions
-        regions_content = []
-        for i in range(100):
-            regions_content.append(
-                f"REGION_{i:03d} (rw) : ORIGIN = 0x{0x20000000 + i*0x1000:08x}, LENGTH = 4K")
-
-        content = f'''
-        MEMORY
-        {{
-            {chr(10).join(regions_content)}
-        }}
-        '''
-
-        file_path = self.create_test_file(content)
-        regions = parse_linker_scripts([str(file_path)])
+        # Create a script with many regions, joined in a single pass
+        content = "\n".join([
+            "MEMORY",
+            "{",
+            *(f"    REGION_{i:03d} (rw) : "
+              f"ORIGIN = 0x{0x20000000 + i * 0x1000:08x}, LENGTH = 4K"
+              for i in range(100)),
+            "}",
+        ])
+
+        regions = parse_linker_scripts_from_string(content)
 
         # Should handle large number of regions
-        self.assertIsInstance(regions, dict)
-        # Should get most or all regions
-        self.assertLessEqual(len(regions), 100)
+        # Every region should be parsed
+        self.assertEqual(len(regions), 100)
 
     def test_unicode_and_special_characters(self):
         """Test handling of unicode and special characters"""
@@ -531,10 +471,8 @@ class TestEdgeCasesAndBoundaryConditions(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         try:
-            regions = parse_linker_scripts([str(file_path)])
+            regions = parse_linker_scripts_from_string(content)
             self.assertIsInstance(regions, dict)
             # Some regions might parse, others might not due to invalid
             # characters
@@ -560,14 +498,41 @@ class TestEdgeCasesAndBoundaryConditions(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should raise RegionParsingError for malformed comments
         with self.assertRaises(RegionParsingError):
-            parse_linker_scripts([str(file_path)])
-
-
-class TestSpecificExceptionTypes(TestMalformedLinkerScripts):
+            parse_linker_scripts_from_string(content)
+
+    def test_concurrent_parses_do_not_share_state(self):
+        """Parsers running in parallel threads give their sequential results"""
+        def outcome(content):
+            try:
+                return parse_linker_scripts_from_string(content)
+            except RegionParsingError as e:
+                return type(e)
+
+        # Same variable and region names with different values per script,
+        # interleaved with scripts that fail, so leaked state would show
+        contents = []
+        for i in range(16):
+            if i % 4 == 3:
+                contents.append(
+                    "MEMORY { FLASH (rx) : ORIGIN = 0xGG, LENGTH = 512K }")
+            else:
+                contents.append(
+                    f"_size = {i + 1}K;\n"
+                    f"MEMORY {{ FLASH (rx) : ORIGIN = 0x{i:x}000, "
+                    f"LENGTH = _size }}")
+
+        expected = [outcome(content) for content in contents]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(outcome, contents))
+
+        self.assertEqual(results, expected)
+        self.assertEqual(expected[1]['FLASH']['limit_size'], 2 * 1024)
+        self.assertIs(expected[3], RegionParsingError)
+
+
+class TestSpecificExceptionTypes(unittest.TestCase):
     """Test that specific exception types are raised appropriately"""
 
     def test_expression_evaluation_errors(self):
@@ -580,11 +545,9 @@ class TestSpecificExceptionTypes(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should either parse gracefully or raise appropriate exception
         try:
-            regions = parse_linker_scripts([str(file_path)])
+            regions = parse_linker_scripts_from_string(content)
             # If it doesn't raise an exception, it should handle gracefully
             self.assertIsInstance(regions, dict)
         except (ExpressionEvaluationError, LinkerScriptError):
@@ -607,11 +570,9 @@ class TestSpecificExceptionTypes(TestMalformedLinkerScripts):
         }
         '''
 
-        file_path = self.create_test_file(content)
-
         # Should raise RegionParsingError for invalid syntax
         with self.assertRaises(RegionParsingError):
-            parse_linker_scripts([str(file_path)])
+            parse_linker_scripts_from_string(content)
 
 
 if __name__ == '__main__':
@@ -10,19 +10,15 @@ based on real MicroPython linker scripts.
 # pylint: disable=too-many-lines
 
 import os
-import sys
 import tempfile
 import unittest
-from pathlib import Path
+from unittest import mock
 
 from membrowse.linker.parser import (
     RegionParsingError, LinkerScriptParser, ScriptContentCleaner, parse_linker_scripts
 )
 from tests.test_utils import validate_memory_regions
 
-# Add shared directory to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
-
 
 class TestLinkerScriptParser(unittest.TestCase):
     """Unit tests for LinkerScriptParser class"""
@@ -637,6 +633,38 @@ class TestLinkerScriptParser(unittest.TestCase):
         self.assertEqual(dtcm['address'], 0x20000000)
         self.assertEqual(dtcm['limit_size'], 0x20000)
 
+    def test_dependency_retries_reuse_cleaned_memory_blocks(self):
+        """Retrying deferred regions should not re-clean the scripts"""
+        dependent_path = self.create_temp_linker_script("""
+        MEMORY
+        {
+            RAM2 (rw) : ORIGIN = ORIGIN(RAM) + LENGTH(RAM), LENGTH = 16K
+        }
+        """)
+        base_path = self.create_temp_linker_script("""
+        MEMORY
+        {
+            RAM (rw) : ORIGIN = 0x20000000, LENGTH = 64K
+        }
+        """)
+
+        def count_clean_calls(scripts):
+            with mock.patch.object(
+                    ScriptContentCleaner, 'clean_content',
+                    wraps=ScriptContentCleaner.clean_content) as clean:
+                regions = LinkerScriptParser(scripts).parse_memory_regions()
+            return regions, clean.call_count
+
+        # RAM2 is listed first, so it is deferred until RAM is known
+        retried, retried_calls = count_clean_calls(
+            [dependent_path, base_path])
+        single_pass, single_pass_calls = count_clean_calls(
+            [base_path, dependent_path])
+
+        self.assertEqual(retried, single_pass)
+        self.assertEqual(retried['RAM2']['address'], 0x20010000)
+        self.assertEqual(retried_calls, single_pass_calls)
+
     def test_error_handling(self):
         """Test error handling for invalid inputs"""
         # Test with non-existent file
@@ -5,15 +5,11 @@ Unit tests for source file mapping functionality
 Tests the new address-priority mapping structure for handling duplicate symbol names
 """
 
-import sys
 import unittest
-from pathlib import Path
 from unittest.mock import patch, mock_open
 
 from membrowse.core import ELFAnalyzer
-
-# Add shared directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'shared'))
+from membrowse.analysis.sources import SourceFileResolver
 
 
 class TestSourceFileMapping(unittest.TestCase):
@@ -309,6 +305,97 @@ class TestSourceFileMapping(unittest.TestCase):
             self.assertEqual(result, filename,
                              f'Real file "{filename}" should not be filtered')
 
+    @patch('membrowse.core.analyzer.Path.exists')
+    @patch('membrowse.core.analyzer.os.access')
+    def test_address_fallback_prefers_cu_c_file(self, mock_access, mock_exists):
+        """Nearby line-program hits in a header resolve to the CU's .c file,
+        and repeated lookups of the same address return the memoized result"""
+        mock_exists.return_value = True
+        mock_access.return_value = True
+
+        with patch('builtins.open', mock_open()):
+            with patch('membrowse.core.analyzer.ELFFile'):
+                analyzer = ELFAnalyzer(self.test_elf_path)
+
+        analyzer._dwarf_data = {
+            'address_to_file': {0x1000: '/inc/inline.h'},
+            'symbol_to_file': {},
+            'address_to_cu_file': {0x1000: '/src/driver.c'},
+        }
+        analyzer._source_resolver.dwarf_data = analyzer._dwarf_data
+
+        for _ in range(2):
+            result = analyzer._source_resolver.extract_source_file(
+                'inlined_func', 'FUNC', 0x1004)
+            self.assertEqual(result, 'driver.c')
+        self.assertEqual(
+            analyzer._source_resolver._address_resolved, {0x1004: 'driver.c'})
+
+    def test_find_nearby_address_picks_closest_neighbour(self):
+        """Proximity search returns the closest line address within range,
+        preferring the lower address on a tie"""
+        resolver = SourceFileResolver({
+            'address_to_file': {0x1000: 'a.c', 0x1010: 'b.c', 0x2000: 'c.c'},
+            'symbol_to_file': {},
+            'address_to_cu_file': {},
+        }, {})
+
+        self.assertEqual(resolver._find_nearby_address(0x1003), 0x1000)
+        self.assertEqual(resolver._find_nearby_address(0x100c), 0x1010)
+        self.assertEqual(resolver._find_nearby_address(0x1008), 0x1000)
+        self.assertEqual(resolver._find_nearby_address(0x2064), 0x2000)
+        self.assertIsNone(resolver._find_nearby_address(0x2065))
+        self.assertIsNone(resolver._find_nearby_address(0x1800))
+
+    def test_address_fallback_uses_enclosing_cu_range(self):
+        """FUNC addresses with no nearby line entry resolve to the CU whose
+        address range covers them; high_pc is exclusive"""
+        resolver = SourceFileResolver({
+            'address_to_file': {0x1000: 'a.c'},
+            'symbol_to_file': {},
+            'address_to_cu_file': {},
+            'cu_ranges': [(0x4000, 0x5000, '/src/late.c'),
+                          (0x2000, 0x3000, '/src/early.c')],
+        }, {})
+
+        self.assertEqual(
+            resolver.extract_source_file('f', 'FUNC', 0x2800), 'early.c')
+        self.assertEqual(
+            resolver.extract_source_file('g', 'FUNC', 0x4000), 'late.c')
+        self.assertEqual(resolver.extract_source_file('h', 'FUNC', 0x3000), '')
+        self.assertEqual(resolver.extract_source_file('i', 'FUNC', 0x1800), '')
+
+    def test_extract_source_files_matches_per_symbol_calls(self):
+        """Batch resolution returns the same results, in order, as
+        calling extract_source_file once per symbol"""
+        dwarf_data = {
+            'address_to_file': {0x1000: 'a.c', 0x2000: 'inc/b.h'},
+            'symbol_to_file': {
+                ('main', 0x3000): 'src/main.c',
+                ('defmt', 0x4000): 'defmt_rtt.2465299265768a95-cgu.0',
+            },
+            'address_to_cu_file': {0x2000: 'src/b.c'},
+        }
+        symbols = [
+            ('main', 'FUNC', 0x3000),
+            ('helper', 'FUNC', 0x1002),
+            ('inlined', 'FUNC', 0x2000),
+            ('defmt', 'FUNC', 0x4000),
+            ('missing', 'OBJECT', 0x5000),
+        ]
+
+        expected = [
+            SourceFileResolver(dwarf_data, {}).extract_source_file(*sym)
+            for sym in symbols
+        ]
+        batch = SourceFileResolver(dwarf_data, {}).extract_source_files(symbols)
+
+        self.assertEqual(batch, expected)
+        self.assertEqual(batch, ['main.c', 'a.c', 'b.c', '', ''])
+        self.assertEqual(
+            SourceFileResolver({}, {}).extract_source_files(symbols),
+            [''] * len(symbols))
+
 
 if __name__ == '__main__':
     unittest.main()
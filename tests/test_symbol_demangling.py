@@ -441,6 +441,8 @@ class TestExtractSymbolsRustAttribution(unittest.TestCase):
     def _null_source_resolver(self):
         resolver = Mock(spec=SourceFileResolver)
         resolver.extract_source_file = Mock(return_value='')
+        resolver.extract_source_files = Mock(
+            side_effect=lambda symbols: [''] * len(symbols))
         return resolver
 
     def test_rust_symbol_archive_overwritten_with_crate(self):